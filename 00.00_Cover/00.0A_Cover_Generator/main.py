@@ -5,79 +5,89 @@ Michael Logan Maloney PhD Dissertation Notebook
 Cover page generator with customizable title and date
 """
 
-import os
 import sys
 from datetime import datetime
 from pathlib import Path
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
 
-def generate_cover_page():
-    """Generate a professional cover page for the dissertation notebook"""
-    
-    # Create output directory
-    output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
-    
-    # Generate timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Create figure with professional styling - NO BORDER
-    fig, ax = plt.subplots(figsize=(8.5, 11), facecolor='white')
-    ax.set_xlim(0, 8.5)
-    ax.set_ylim(0, 11)
-    ax.axis('off')
-    
-    # MAIN TITLE - Left aligned, Arial font
-    title_text = "Report"
-    ax.text(1, 9.5, title_text, fontsize=16, fontweight='normal', 
-            ha='left', va='center', fontfamily='Arial', color='black')
-    
-    # AUTHOR INFORMATION - Left aligned, Arial font
-    author_info = [
+# Resolve this module's directories once at import
+MODULE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = MODULE_DIR.parent.parent
+OUTPUT_DIR = MODULE_DIR / "output"
+
+# Add shared J1 helpers to path
+sys.path.append(str(REPO_ROOT))
+from modules.pdf_canvas import cached_template, stamp_page
+
+# Cached static layout (title, author block, page number, module identifier)
+CACHE_DIR = MODULE_DIR / ".cache"
+
+# Cover content; other covers call render_cover() with their own dict
+COVER_CONFIG = {
+    "name": "cover_page_00.00",
+    "title": "Report",
+    "author_lines": [
         "Author: Michael Logan Maloney",
         "Position: PhD Student",
         "Institution: Pennsylvania State University",
         "Department: Architectural Engineering",
         "Laboratory: Sustainable Buildings and Societies Laboratory (SBS Lab)",
         "Advisor: Dr. Wangda Zuo"
-    ]
+    ],
+    "page_number": "1",
+    "module_id": "00.00 - Cover Generator",
+}
+
+def get_static_entries(config):
+    """Static cover text that does not change between runs"""
+    # MAIN TITLE - Left aligned
+    entries = [(1, 9.5, 16, False, 'black', config["title"])]
     
-    # Position author info with left alignment
-    for i, info in enumerate(author_info):
+    # AUTHOR INFORMATION - Left aligned
+    for i, info in enumerate(config["author_lines"]):
         y_pos = 8.5 - (i * 0.4)
-        ax.text(1, y_pos, info, fontsize=14, fontweight='normal', 
-                ha='left', va='center', fontfamily='Arial', color='black')
-    
-    # REPORT GENERATION DATE - Left aligned, Arial font
-    date_text = f"Report Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
-    ax.text(1, 5.5, date_text, fontsize=14, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='black')
+        entries.append((1, y_pos, 14, False, 'black', info))
     
     # Page number
-    ax.text(4.25, 0.5, "1", fontsize=14, fontweight='normal',
-            ha='center', va='center', fontfamily='Arial', color='black')
-    
-    # Timestamp
-    timestamp_text = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    ax.text(1, 0.3, timestamp_text, fontsize=10, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='gray')
+    entries.append((4.25, 0.5, 14, False, 'black', config["page_number"], 'center'))
     
     # Module identifier
-    module_text = "Module: 00.00 - Cover Generator"
-    ax.text(1, 0.1, module_text, fontsize=10, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='gray')
+    entries.append((1, 0.1, 10, False, 'gray', f"Module: {config['module_id']}"))
+    
+    return entries
+
+def render_cover(config, output_dir=OUTPUT_DIR):
+    """Render a cover page described by a config dict (see COVER_CONFIG)"""
+    output_dir.mkdir(exist_ok=True)
+    
+    # Generate timestamp
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     
-    # Save as PDF
-    output_file = output_dir / f"cover_page_00.00_{timestamp}.pdf"
-    with PdfPages(output_file) as pdf:
-        pdf.savefig(fig, dpi=300)
+    # Output file
+    output_file = output_dir / f"{config['name']}_{timestamp}.pdf"
     
-    plt.close()
+    # Static layout is rendered once and reused until it changes
+    template_file = cached_template(CACHE_DIR, f"{config['name']}_template", get_static_entries(config))
+    
+    # REPORT GENERATION DATE - Left aligned
+    date_text = f"Report Generated on {now.strftime('%B %d, %Y at %I:%M %p')}"
+    
+    # Timestamp
+    timestamp_text = f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}"
+    
+    # Save as PDF with only the dynamic text stamped on the template
+    stamp_page(template_file, [
+        (1, 5.5, 14, False, 'black', date_text),
+        (1, 0.3, 10, False, 'gray', timestamp_text),
+    ], output_file)
     
     print(f"✅ Cover page generated: {output_file}")
     return str(output_file)
 
+def generate_cover_page():
+    """Generate a professional cover page for the dissertation notebook"""
+    return render_cover(COVER_CONFIG)
+
 def main():
     """Main function to generate cover page"""
     print("🎨 Generating Cover Page...")
@@ -5,270 +5,183 @@ Michael Logan Maloney PhD Dissertation Notebook
 Comprehensive overview of all active and inactive modules
 """
 import json
+import functools
 import sys
 from datetime import datetime
 from pathlib import Path
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
+
+# Resolve this module's directories once at import
+MODULE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = MODULE_DIR.parent.parent
+OUTPUT_DIR = MODULE_DIR / "output"
+CONFIG_FILE = REPO_ROOT / "module_inputs.json"
+
+# Add shared J1 helpers to path
+sys.path.append(str(REPO_ROOT))
+from modules.pdf_canvas import new_canvas, draw_text_block, draw_hline
+
+# Row layout for main modules vs. submodules
+ROW_STYLES = {
+    'Module': dict(id_x=0.5, name_x=2.5, size=11, bold=True, pitch=0.3, indent=""),
+    'Sub': dict(id_x=0.8, name_x=3.0, size=10, bold=False, pitch=0.25, indent="  "),
+}
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path_str, mtime):
+    """Parse a JSON file; keyed on mtime so edits to the file are picked up"""
+    return json.loads(Path(path_str).read_text())
 
 def load_module_config():
     """Load module configuration from module_inputs.json"""
     try:
-        config_file = Path(__file__).parent / ".." / ".." / "module_inputs.json"
-        if config_file.exists():
-            with open(config_file, 'r') as f:
-                return json.load(f)
+        if CONFIG_FILE.exists():
+            return _load_cached(str(CONFIG_FILE), CONFIG_FILE.stat().st_mtime)
         else:
-            print(f"⚠️ module_inputs.json not found at {config_file}")
+            print(f"⚠️ module_inputs.json not found at {CONFIG_FILE}")
             return {}
     except Exception as e:
         print(f"⚠️ Error loading module config: {e}")
         return {}
 
+def row_style(entry):
+    """Sort key grouping buffered row cells by (size, bold, color)"""
+    return entry[2:5]
+
+def new_page(c):
+    """Finish the current page and draw the continuation header on the same canvas"""
+    c.showPage()
+    draw_text_block(c, [
+        (4.25, 10.5, 16, True, 'black', "Module Status Overview (Continued)", 'center'),
+        (4.25, 10, 12, False, 'black', "Michael Logan Maloney PhD Dissertation Notebook", 'center'),
+    ])
+    return 9.5
+
 def generate_module_status_overview():
     """Generate a comprehensive module status overview"""
-    output_dir = Path(__file__).parent / "output"
+    output_dir = OUTPUT_DIR
     output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     module_config = load_module_config()
     
     if not module_config:
         print("❌ Failed to load module configuration")
         return None
     
-    print(f"📊 Loaded {len(module_config.get('modules', {}))} modules from configuration")
-    
-    # Create PDF version using PdfPages
-    pdf_file = output_dir / f"module_status_overview_{timestamp}.pdf"
-    
-    with PdfPages(pdf_file) as pdf:
-        # Create a new figure for the PDF with correct 8.5 x 11 size
-        fig = plt.figure(figsize=(8.5, 11), facecolor='white')
-        ax = fig.add_subplot(111)
-        ax.set_xlim(0, 8.5)
-        ax.set_ylim(0, 11)
-        ax.axis('off')
-        
-
-        
-        # Title
-        title_text = "Module Status Overview"
-        ax.text(4.25, 10.5, title_text, fontsize=16, fontweight='bold',
-                ha='center', va='center', fontfamily='Arial')
-
-        subtitle_text = "Michael Logan Maloney PhD Dissertation Notebook"
-        ax.text(4.25, 10, subtitle_text, fontsize=12, fontweight='normal',
-                ha='center', va='center', fontfamily='Arial')
-        
-        timestamp_text = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ax.text(4.25, 9.7, timestamp_text, fontsize=10, fontweight='normal',
-                ha='center', va='center', fontfamily='Arial')
-
-        # Summary statistics
-        total_modules = len(module_config.get('modules', {}))
-        active_modules = sum(1 for module in module_config.get('modules', {}).values() 
-                           if module.get('active', False))
-        inactive_modules = total_modules - active_modules
-        
-        summary_text = f"Total Modules: {total_modules} | Active: {active_modules} | Inactive: {inactive_modules}"
-        ax.text(4.25, 9.4, summary_text, fontsize=10, fontweight='bold',
-                ha='center', va='center', fontfamily='Arial')
-
-        # Column headers
-        ax.text(0.5, 9.0, "Module ID", fontsize=11, fontweight='bold',
-                ha='left', va='center', fontfamily='Arial')
-        ax.text(2.5, 9.0, "Module Name", fontsize=11, fontweight='bold',
-                ha='left', va='center', fontfamily='Arial')
-        ax.text(7.0, 9.0, "Status", fontsize=11, fontweight='bold',
-                ha='center', va='center', fontfamily='Arial')
-        
-        # Separator line
-        ax.axhline(y=8.8, xmin=0.05, xmax=0.95, color='black', linewidth=0.5)
-
-        # Generate overview entries
-        y_position = 8.5
-        modules_processed = 0
-        
-        # Process modules in order
-        for module_id, module_info in sorted(module_config.get('modules', {}).items()):
-            if module_id in ['main.py', 'module_inputs.json']:
-                continue  # Skip system files
-                
-            module_name = module_info.get('name', 'Unknown')
-            module_type = module_info.get('type', 'Unknown')
-            module_status = module_info.get('active', False)
-            
-            print(f"  📝 Processing: {module_id} - {module_name} ({module_type}) - {module_status}")
-            
-            # Color code based on status
-            status_color = 'green' if module_status else 'red'
-            status_text = 'ACTIVE' if module_status else 'INACTIVE'
-            
-            # Determine indentation based on module type
-            if module_type == 'Module':
-                # Main module - bold
-                ax.text(0.5, y_position, f"{module_id}", fontsize=11, fontweight='bold',
-                        ha='left', va='center', fontfamily='Arial')
-                ax.text(2.5, y_position, f"{module_name}", fontsize=11, fontweight='bold',
-                        ha='left', va='center', fontfamily='Arial')
-                ax.text(7.0, y_position, f"{status_text}", fontsize=11, fontweight='bold',
-                        ha='center', va='center', fontfamily='Arial', color=status_color)
-                y_position -= 0.3
-            else:
-                # Submodule - normal weight, indented
-                ax.text(0.8, y_position, f"  {module_id}", fontsize=10, fontweight='normal',
-                        ha='left', va='center', fontfamily='Arial')
-                ax.text(3.0, y_position, f"{module_name}", fontsize=10, fontweight='normal',
-                        ha='left', va='center', fontfamily='Arial')
-                ax.text(7.0, y_position, f"{status_text}", fontsize=10, fontweight='normal',
-                        ha='center', va='center', fontfamily='Arial', color=status_color)
-                y_position -= 0.25
-            
-            modules_processed += 1
-            
-            # Check if we need a new page
-            if y_position < 1.0:
-                # Save current page and start new one
-                pdf.savefig(fig, dpi=300)
-                plt.close()
-                
-                # Create second page
-                fig = plt.figure(figsize=(8.5, 11), facecolor='white')
-                ax = fig.add_subplot(111)
-                ax.set_xlim(0, 8.5)
-                ax.set_ylim(0, 11)
-                ax.axis('off')
-                
-
-                
-                # Page 2 header
-                ax.text(4.25, 10.5, "Module Status Overview (Continued)", fontsize=16, fontweight='bold',
-                        ha='center', va='center', fontfamily='Arial')
-                ax.text(4.25, 10, "Michael Logan Maloney PhD Dissertation Notebook", fontsize=12, fontweight='normal',
-                        ha='center', va='center', fontfamily='Arial')
-                
-                y_position = 9.5
-
-        # Footer information for debugging
-        footer_y = 1.0
-        
-        # Timestamp - left justified
-        timestamp_text = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ax.text(0.1, footer_y, timestamp_text, fontsize=10, fontweight='normal',
-                ha='left', va='center', fontfamily='Arial', color='gray')
-        
-        # Module identifier - left justified
-        module_text = "Module: 00.0A - Module Status Overview"
-        ax.text(0.1, footer_y - 0.3, module_text, fontsize=10, fontweight='normal',
-                ha='left', va='center', fontfamily='Arial', color='gray')
-        
-        # Legend
-        legend_y = 2.0
-        ax.text(0.5, legend_y, "Legend:", fontsize=10, fontweight='bold',
-                ha='left', va='center', fontfamily='Arial')
-        ax.text(0.5, legend_y - 0.2, "• ACTIVE: Module will be executed and included in final PDF", fontsize=9, fontweight='normal',
-                ha='left', va='center', fontfamily='Arial')
-        ax.text(0.5, legend_y - 0.4, "• INACTIVE: Module will be skipped during execution", fontsize=9, fontweight='normal',
-                ha='left', va='center', fontfamily='Arial')
-        ax.text(0.5, legend_y - 0.6, "• Module ID format: XX.YY where XX = main module, YY = submodule", fontsize=9, fontweight='normal',
-                ha='left', va='center', fontfamily='Arial')
-
-        print(f"📊 Processed {modules_processed} modules, saving PDF...")
-        
-        # Save the final page with high DPI and proper sizing
-        pdf.savefig(fig, dpi=300)
-        plt.close()
-    
-    print(f"✅ PDF saved: {pdf_file}")
+    modules = module_config.get('modules', {})
+    print(f"📊 Loaded {len(modules)} modules from configuration")
     
-    # Also save as PNG for reference (simplified version)
-    png_file = output_dir / f"module_status_overview_{timestamp}.png"
+    # Sort and drop system files once, up front
+    entries = [(module_id, module_info) for module_id, module_info in sorted(modules.items())
+               if module_id not in ('main.py', 'module_inputs.json')]
     
-    # Create a new figure for PNG
-    fig, ax = plt.subplots(figsize=(8.5, 11), facecolor='white')
-    ax.set_xlim(0, 8.5)
-    ax.set_ylim(0, 11)
-    ax.axis('off')
+    # Create PDF version on a ReportLab canvas
+    pdf_file = output_dir / f"module_status_overview_{timestamp}.pdf"
+    c = new_canvas(pdf_file)
     
     # Title
-    ax.text(4.25, 10.5, title_text, fontsize=16, fontweight='bold',
-            ha='center', va='center', fontfamily='Arial')
-    ax.text(4.25, 10, subtitle_text, fontsize=12, fontweight='normal',
-            ha='center', va='center', fontfamily='Arial')
-    ax.text(4.25, 9.7, timestamp_text, fontsize=10, fontweight='normal',
-            ha='center', va='center', fontfamily='Arial')
-    ax.text(4.25, 9.4, summary_text, fontsize=10, fontweight='bold',
-            ha='center', va='center', fontfamily='Arial')
-    
-    # Column headers
-    ax.text(0.5, 9.0, "Module ID", fontsize=11, fontweight='bold',
-            ha='left', va='center', fontfamily='Arial')
-    ax.text(2.5, 9.0, "Module Name", fontsize=11, fontweight='bold',
-            ha='left', va='center', fontfamily='Arial')
-    ax.text(7.0, 9.0, "Status", fontsize=11, fontweight='bold',
-            ha='center', va='center', fontfamily='Arial')
+    title_text = "Module Status Overview"
+    subtitle_text = "Michael Logan Maloney PhD Dissertation Notebook"
+    timestamp_text = f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}"
+    
+    # Summary statistics
+    total_modules = len(modules)
+    active_modules = sum(1 for module in modules.values() if module.get('active', False))
+    inactive_modules = total_modules - active_modules
+    
+    summary_text = f"Total Modules: {total_modules} | Active: {active_modules} | Inactive: {inactive_modules}"
+    
+    draw_text_block(c, [
+        (4.25, 10.5, 16, True, 'black', title_text, 'center'),
+        (4.25, 10, 12, False, 'black', subtitle_text, 'center'),
+        (4.25, 9.7, 10, False, 'black', timestamp_text, 'center'),
+        (4.25, 9.4, 10, True, 'black', summary_text, 'center'),
+        # Column headers
+        (0.5, 9.0, 11, True, 'black', "Module ID"),
+        (2.5, 9.0, 11, True, 'black', "Module Name"),
+        (7.0, 9.0, 11, True, 'black', "Status", 'center'),
+    ])
     
     # Separator line
-    ax.axhline(y=8.8, xmin=0.05, xmax=0.95, color='black', linewidth=0.5)
+    draw_hline(c, 8.8, 0.425, 8.075)
     
-    # Generate overview entries for PNG
+    # Generate overview entries; rows are buffered and drawn once per page
     y_position = 8.5
-    for module_id, module_info in sorted(module_config.get('modules', {}).items()):
-        if module_id in ['main.py', 'module_inputs.json']:
-            continue
-            
+    modules_processed = 0
+    rows = []
+    
+    # Process modules in order
+    for module_id, module_info in entries:
         module_name = module_info.get('name', 'Unknown')
         module_type = module_info.get('type', 'Unknown')
         module_status = module_info.get('active', False)
         
+        print(f"  📝 Processing: {module_id} - {module_name} ({module_type}) - {module_status}")
+        
+        # Color code based on status
         status_color = 'green' if module_status else 'red'
         status_text = 'ACTIVE' if module_status else 'INACTIVE'
         
-        if module_type == 'Module':
-            ax.text(0.5, y_position, f"{module_id}", fontsize=11, fontweight='bold',
-                    ha='left', va='center', fontfamily='Arial')
-            ax.text(2.5, y_position, f"{module_name}", fontsize=11, fontweight='bold',
-                    ha='left', va='center', fontfamily='Arial')
-            ax.text(7.0, y_position, f"{status_text}", fontsize=11, fontweight='bold',
-                    ha='center', va='center', fontfamily='Arial', color=status_color)
-            y_position -= 0.3
-        else:
-            ax.text(0.8, y_position, f"  {module_id}", fontsize=10, fontweight='normal',
-                    ha='left', va='center', fontfamily='Arial')
-            ax.text(3.0, y_position, f"{module_name}", fontsize=10, fontweight='normal',
-                    ha='left', va='center', fontfamily='Arial')
-            ax.text(7.0, y_position, f"{status_text}", fontsize=10, fontweight='normal',
-                    ha='center', va='center', fontfamily='Arial', color=status_color)
-            y_position -= 0.25
-    
-    # Footer information for debugging (PNG version)
+        # Main modules are bold; submodules are normal weight and indented
+        style = ROW_STYLES['Module' if module_type == 'Module' else 'Sub']
+        size, bold = style['size'], style['bold']
+        rows.extend([
+            (style['id_x'], y_position, size, bold, 'black', f"{style['indent']}{module_id}"),
+            (style['name_x'], y_position, size, bold, 'black', f"{module_name}"),
+            (7.0, y_position, size, bold, status_color, f"{status_text}", 'center'),
+        ])
+        y_position -= style['pitch']
+        
+        modules_processed += 1
+        
+        # Check if we need a new page
+        if y_position < 1.0:
+            # Finish current page and start new one
+            draw_text_block(c, sorted(rows, key=row_style))
+            rows = []
+            y_position = new_page(c)
+
+    draw_text_block(c, sorted(rows, key=row_style))
+
+    # Footer information for debugging
     footer_y = 1.0
     
-    # Timestamp - left justified
-    timestamp_text = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    ax.text(0.1, footer_y, timestamp_text, fontsize=10, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='gray')
-    
     # Module identifier - left justified
     module_text = "Module: 00.0A - Module Status Overview"
-    ax.text(0.1, footer_y - 0.3, module_text, fontsize=10, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='gray')
     
-    # Legend for PNG
+    # Legend
     legend_y = 2.0
-    ax.text(0.5, legend_y, "Legend:", fontsize=10, fontweight='bold',
-            ha='left', va='center', fontfamily='Arial')
-    ax.text(0.5, legend_y - 0.2, "• ACTIVE: Module will be executed and included in final PDF", fontsize=9, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial')
-    ax.text(0.5, legend_y - 0.4, "• INACTIVE: Module will be skipped during execution", fontsize=9, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial')
-    ax.text(0.5, legend_y - 0.6, "• Module ID format: XX.YY where XX = main module, YY = submodule", fontsize=9, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial')
+    draw_text_block(c, [
+        (0.1, footer_y, 10, False, 'gray', timestamp_text),
+        (0.1, footer_y - 0.3, 10, False, 'gray', module_text),
+        (0.5, legend_y, 10, True, 'black', "Legend:"),
+        (0.5, legend_y - 0.2, 9, False, 'black', "• ACTIVE: Module will be executed and included in final PDF"),
+        (0.5, legend_y - 0.4, 9, False, 'black', "• INACTIVE: Module will be skipped during execution"),
+        (0.5, legend_y - 0.6, 9, False, 'black', "• Module ID format: XX.YY where XX = main module, YY = submodule"),
+    ])
+
+    print(f"📊 Processed {modules_processed} modules, saving PDF...")
     
-    plt.savefig(png_file, dpi=300)
-    plt.close()
+    # Save the final page
+    c.showPage()
+    c.save()
+    
+    print(f"✅ PDF saved: {pdf_file}")
+    
+    # Also save as PNG for reference, rasterized from the PDF rather than
+    # laying the page out a second time
+    png_file = output_dir / f"module_status_overview_{timestamp}.png"
+    try:
+        # Render the first page in-process with PDFium (no Poppler subprocess)
+        import pypdfium2 as pdfium
+        pdfium.PdfDocument(str(pdf_file))[0].render(scale=150 / 72).to_pil().save(png_file, 'PNG')
+    except Exception as e:
+        print(f"⚠️ Could not rasterize PNG: {e}")
     
-    print(f"✅ Module Status Overview generated: {png_file} and {pdf_file}")
+    if png_file.exists():
+        print(f"✅ Module Status Overview generated: {png_file} and {pdf_file}")
+    else:
+        print(f"✅ Module Status Overview generated: {pdf_file}")
     return pdf_file
 
 def main():
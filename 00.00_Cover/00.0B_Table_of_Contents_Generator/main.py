@@ -5,29 +5,26 @@ Michael Logan Maloney PhD Dissertation Notebook
 Table of Contents generator based on active modules
 """
 
-import os
 import sys
 import json
-import yaml
 from datetime import datetime
 from pathlib import Path
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
 
-def load_config():
-    """Load configuration from config.yaml"""
-    config_file = Path("config.yaml")
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
-    return {}
+# Resolve this module's directories once at import
+MODULE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = MODULE_DIR.parent.parent
+OUTPUT_DIR = MODULE_DIR / "output"
+CONFIG_FILE = REPO_ROOT / "module_inputs.json"
+
+# Add shared J1 helpers to path
+sys.path.append(str(REPO_ROOT))
+from modules.pdf_canvas import new_canvas, draw_text_block
 
 def get_active_modules():
     """Get list of active modules from module_inputs.json"""
     try:
-        config_file = Path(__file__).parent / ".." / ".." / "module_inputs.json"
-        if config_file.exists():
-            with open(config_file, 'r') as f:
+        if CONFIG_FILE.exists():
+            with open(CONFIG_FILE, 'r') as f:
                 module_config = json.load(f)
             
             # Get the modules from the correct structure
@@ -50,22 +47,47 @@ def get_active_modules():
             
             return active_modules
         else:
-            print(f"⚠️ module_inputs.json not found at {config_file}")
+            print(f"⚠️ module_inputs.json not found at {CONFIG_FILE}")
             return {}
             
     except Exception as e:
         print(f"⚠️ Error loading module config: {e}")
         return {}
 
+def group_modules(active_modules):
+    """
+    Group active modules under their main module (XX.00) in one sorted pass.
+    Returns {main_id: [(sub_id, sub_info), ...]} in ID order; the main module
+    itself is not repeated in its submodule list.
+    """
+    groups = {}
+    for module_id, module_info in sorted(active_modules.items()):
+        # Main modules end with .00 and sort first within their group
+        main_id = module_id.partition('.')[0] + '.00'
+        submodules = groups.setdefault(main_id, [])
+        if module_id != main_id:
+            submodules.append((module_id, module_info))
+    return groups
+
+def new_page(c, current_page):
+    """Finish the current page and draw the continuation header on the same canvas"""
+    c.showPage()
+    draw_text_block(c, [
+        (4.25, 10.5, 14, False, 'black', f"Table of Contents (Page {current_page})", 'center'),
+        (4.25, 10, 14, False, 'black', "Michael Logan Maloney PhD Dissertation Notebook", 'center'),
+    ])
+    return 9.5
+
 def generate_table_of_contents():
     """Generate a professional table of contents"""
     
     # Create output directory
-    output_dir = Path("output")
+    output_dir = OUTPUT_DIR
     output_dir.mkdir(exist_ok=True)
     
     # Generate timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     
     # Get active modules
     active_modules = get_active_modules()
@@ -73,137 +95,73 @@ def generate_table_of_contents():
     # Create output file
     output_file = output_dir / f"table_of_contents_00.0B_{timestamp}.pdf"
     
-    with PdfPages(output_file) as pdf:
-        # Create first page
-        fig = plt.figure(figsize=(8.5, 11), facecolor='white')
-        ax = fig.add_subplot(111)
-        ax.set_xlim(0, 8.5)
-        ax.set_ylim(0, 11)
-        ax.axis('off')
-        
-        # Title
-        title_text = "Table of Contents"
-        ax.text(4.25, 10.5, title_text, fontsize=14, fontweight='normal',
-                ha='center', va='center', fontfamily='Arial')
-
-        subtitle_text = "Michael Logan Maloney PhD Dissertation Notebook"
-        ax.text(4.25, 10, subtitle_text, fontsize=14, fontweight='normal',
-                ha='center', va='center', fontfamily='Arial')
-
-        # Generate TOC entries
-        y_position = 9.5  # Start higher to give more space
-        page_number = 1
-        current_page = 1
-
-        # Group modules by their main module
-        main_modules = {}
-        for module_id, module_info in active_modules.items():
-            if module_id == 'main.py':
-                continue
-
-            main_id_prefix = module_id.split('.')[0]
-            main_id = main_id_prefix + '.00' # Assuming main modules end with .00
-
-            # Handle cases where the main module itself is listed (e.g., 00.00)
-            if module_id == main_id:
-                if main_id not in main_modules:
-                    main_modules[main_id] = []
-                main_modules[main_id].insert(0, (module_id, module_info)) # Ensure main module is first
-            else:
-                if main_id not in main_modules:
-                    main_modules[main_id] = []
-                main_modules[main_id].append((module_id, module_info))
-
-        # Sort main modules by ID
-        sorted_main_modules = sorted(main_modules.items())
-
-        for main_id, submodules in sorted_main_modules:
+    c = new_canvas(output_file)
+    
+    # Title
+    title_text = "Table of Contents"
+    subtitle_text = "Michael Logan Maloney PhD Dissertation Notebook"
+    draw_text_block(c, [
+        (4.25, 10.5, 14, False, 'black', title_text, 'center'),
+        (4.25, 10, 14, False, 'black', subtitle_text, 'center'),
+    ])
+
+    # Generate TOC entries
+    y_position = 9.5  # Start higher to give more space
+    page_number = 1
+    current_page = 1
+
+    # Group modules by their main module
+    toc_structure = group_modules(active_modules)
+
+    for main_id, submodules in toc_structure.items():
+        # Check if we need a new page
+        if y_position < 1.5:  # Leave more space at bottom
+            current_page += 1
+            y_position = new_page(c, current_page)
+
+        # Add main module
+        main_module_info = active_modules.get(main_id, {'name': 'Unknown', 'type': 'Module'})
+        main_text = f"{main_id} {main_module_info['name']}"
+        draw_text_block(c, [
+            (0.5, y_position, 14, False, 'black', main_text),
+            (7.5, y_position, 14, False, 'black', str(page_number), 'right'),
+        ])
+        y_position -= 0.4
+        page_number += 1
+
+        # Add submodules (already sorted by group_modules)
+        for sub_id, sub_info in submodules:
             # Check if we need a new page
-            if y_position < 1.5:  # Leave more space at bottom
-                # Save current page and start new one
-                pdf.savefig(fig, dpi=300)
-                plt.close()
+            if y_position < 1.5:
                 current_page += 1
-                
-                # Create next page
-                fig = plt.figure(figsize=(8.5, 11), facecolor='white')
-                ax = fig.add_subplot(111)
-                ax.set_xlim(0, 8.5)
-                ax.set_ylim(0, 11)
-                ax.axis('off')
-                
-                # Page header
-                ax.text(4.25, 10.5, f"Table of Contents (Page {current_page})", fontsize=14, fontweight='normal',
-                        ha='center', va='center', fontfamily='Arial')
-                ax.text(4.25, 10, "Michael Logan Maloney PhD Dissertation Notebook", fontsize=14, fontweight='normal',
-                        ha='center', va='center', fontfamily='Arial')
-                
-                y_position = 9.5
-
-            # Add main module
-            main_module_info = active_modules.get(main_id, {'name': 'Unknown', 'type': 'Module'})
-            main_text = f"{main_id} {main_module_info['name']}"
-            ax.text(0.5, y_position, main_text, fontsize=14, fontweight='normal',
-                    ha='left', va='center', fontfamily='Arial')
-            ax.text(7.5, y_position, str(page_number), fontsize=14, fontweight='normal',
-                    ha='right', va='center', fontfamily='Arial')
-            y_position -= 0.4
+                y_position = new_page(c, current_page)
+            
+            sub_text = f"  {sub_id} {sub_info['name']}"
+            draw_text_block(c, [
+                (0.5, y_position, 14, False, 'black', sub_text),
+                (7.5, y_position, 14, False, 'black', str(page_number), 'right'),
+            ])
+            y_position -= 0.3
             page_number += 1
 
-            # Add submodules
-            # Sort submodules to ensure consistent order
-            sorted_submodules = sorted([s for s in submodules if s[0] != main_id])
-            for sub_id, sub_info in sorted_submodules:
-                # Check if we need a new page
-                if y_position < 1.5:
-                    # Save current page and start new one
-                    pdf.savefig(fig, dpi=300)
-                    plt.close()
-                    current_page += 1
-                    
-                    # Create next page
-                    fig = plt.figure(figsize=(8.5, 11), facecolor='white')
-                    ax = fig.add_subplot(111)
-                    ax.set_xlim(0, 8.5)
-                    ax.set_ylim(0, 11)
-                    ax.axis('off')
-                    
-                    # Page header
-                    ax.text(4.25, 10.5, f"Table of Contents (Page {current_page})", fontsize=14, fontweight='normal',
-                            ha='center', va='center', fontfamily='Arial')
-                    ax.text(4.25, 10, "Michael Logan Maloney PhD Dissertation Notebook", fontsize=14, fontweight='normal',
-                            ha='center', va='center', fontfamily='Arial')
-                    
-                    y_position = 9.5
-                
-                sub_text = f"  {sub_id} {sub_info['name']}"
-                ax.text(0.5, y_position, sub_text, fontsize=14, fontweight='normal',
-                        ha='left', va='center', fontfamily='Arial')
-                ax.text(7.5, y_position, str(page_number), fontsize=14, fontweight='normal',
-                        ha='right', va='center', fontfamily='Arial')
-                y_position -= 0.3
-                page_number += 1
-
-            y_position -= 0.2  # Extra space between main modules
-
-        # Footer information
-        footer_text = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ax.text(4.25, 0.5, footer_text, fontsize=10, fontweight='normal',
-                ha='center', va='center', fontfamily='Arial')
+        y_position -= 0.2  # Extra space between main modules
 
+    # Footer information
+    footer_text = f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}"
+
+    # Module identifier
+    module_text = "Module: 00.0B - Table of Contents Generator"
+    
+    draw_text_block(c, [
+        (4.25, 0.5, 10, False, 'black', footer_text, 'center'),
         # Page number
-        ax.text(4.25, 0.3, str(current_page), fontsize=14, fontweight='normal',
-                ha='center', va='center', fontfamily='Arial')
-
-        # Module identifier
-        module_text = "Module: 00.0B - Table of Contents Generator"
-        ax.text(4.25, 0.1, module_text, fontsize=10, fontweight='normal',
-                ha='center', va='center', fontfamily='Arial')
-        
-        # Save the final page
-        pdf.savefig(fig, dpi=300)
+        (4.25, 0.3, 14, False, 'black', str(current_page), 'center'),
+        (4.25, 0.1, 10, False, 'black', module_text, 'center'),
+    ])
     
-    plt.close()
+    # Save the final page
+    c.showPage()
+    c.save()
     
     print(f"✅ Table of contents generated: {output_file}")
     return str(output_file)
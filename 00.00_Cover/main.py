@@ -11,138 +11,162 @@ Professional cover page generation.
 """
 
 import sys
-import subprocess
-import tempfile
+import json
+import string
+import hashlib
 from datetime import datetime
 from pathlib import Path
-import warnings
-warnings.filterwarnings('ignore')
 
-def generate_cover_page():
-    """Generate a professional cover page using LaTeX formatting like the J1 Journal 1"""
-    
-    output_dir = Path(__file__).parent / "output"
-    output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Generate PDF
-    pdf_path = output_dir / f"cover_page_{timestamp}.pdf"
-    
-    # Main Cover Page LaTeX template - Nice formatting like J1 Journal 1
-    latex_content = f"""
-\\documentclass[12pt]{{article}}
-\\usepackage[utf8]{{inputenc}}
-\\usepackage[margin=1in]{{geometry}}
-\\usepackage{{times}}
-\\usepackage{{setspace}}
+# Resolved once at import
+MODULE_DIR = Path(__file__).resolve().parent
+OUTPUT_DIR = MODULE_DIR / "output"
 
-\\doublespacing
+# Compiled static covers, keyed by a hash of their LaTeX source
+CACHE_DIR = MODULE_DIR / ".cache"
 
-\\begin{{document}}
+# Add shared J1 helpers to path
+sys.path.append(str(MODULE_DIR.parent))
+from modules.pdf_canvas import stamp_page, PAGE_FRAME
+from modules.latex import compile_latex, latex_escape
 
-\\vspace{{2cm}}
+# pypdf is preferred, but PyPDF2 reads text positions the same way
+try:
+    from pypdf import PdfReader
+except ImportError:
+    from PyPDF2 import PdfReader
 
-\\noindent\\Large\\textbf{{Report}}
+# The two date lines are stamped onto the compiled page afterwards so the
+# LaTeX source (and therefore the cache key) does not change every run. Where
+# they go is read back from the engine's own output: the cover is compiled once
+# more with marker digits in the two placeholder lines, and each marker's
+# baseline is recorded next to the cached cover. Values are (marker, font size).
+PLACEHOLDER = r"\strut"
+DATE_LINES = {
+    'date': ("1111", 12),
+    'timestamp': ("2222", 10.95),
+}
 
-\\vspace{{3cm}}
+# Cover LaTeX, parsed once at import. Field values are escaped before
+# substitution so names containing LaTeX specials (& % _ ...) still compile.
+_LATEX_TEMPLATE = string.Template(r"""
+\documentclass[12pt]{article}
+\usepackage[utf8]{inputenc}
+\usepackage[margin=1in]{geometry}
+\usepackage{times}
+\usepackage{setspace}
 
-\\noindent\\normalsize\\textbf{{Author: Michael Logan Maloney}}
+\doublespacing
 
-\\noindent\\normalsize\\textbf{{Position: PhD Student}}
+\begin{document}
 
-\\noindent\\normalsize\\textbf{{Institution: Pennsylvania State University}}
+\vspace{2cm}
 
-\\noindent\\normalsize\\textbf{{Department: Architectural Engineering}}
+\noindent\Large\textbf{Report}
 
-\\noindent\\normalsize\\textbf{{Laboratory: Sustainable Buildings and Societies Laboratory (SBS Lab)}}
+\vspace{3cm}
 
-\\noindent\\normalsize\\textbf{{Advisor: Dr. Wangda Zuo}}
+\noindent\normalsize\textbf{Author: $author}
 
-\\vspace{{2cm}}
+\noindent\normalsize\textbf{Position: $position}
 
-\\noindent\\normalsize\\textit{{Report Generated on {datetime.now().strftime("%B %d, %Y at %I:%M %p")}}}
+\noindent\normalsize\textbf{Institution: $institution}
 
-\\vspace{{1cm}}
+\noindent\normalsize\textbf{Department: $department}
 
-\\noindent\\small\\textit{{Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}}}
+\noindent\normalsize\textbf{Laboratory: $laboratory}
 
-\\noindent\\small\\textit{{Module: 00.00 - Cover}}
+\noindent\normalsize\textbf{Advisor: $advisor}
 
-\\end{{document}}
-"""
+\vspace{2cm}
+
+\noindent\normalsize$date_line
+
+\vspace{1cm}
+
+\noindent\small$timestamp_line
+
+\noindent\small\textit{Module: 00.00 - Cover}
+
+\end{document}
+""")
+
+COVER_FIELDS = {
+    'author': "Michael Logan Maloney",
+    'position': "PhD Student",
+    'institution': "Pennsylvania State University",
+    'department': "Architectural Engineering",
+    'laboratory': "Sustainable Buildings and Societies Laboratory (SBS Lab)",
+    'advisor': "Dr. Wangda Zuo",
+}
+
+def cover_source(**date_lines):
+    """Cover LaTeX with the given contents in the two date lines"""
+    fields = {name: latex_escape(value) for name, value in COVER_FIELDS.items()}
+    return _LATEX_TEMPLATE.substitute(fields, **date_lines)
+
+def locate_date_lines(probe_pdf):
+    """
+    Compile the cover with marker digits after the date line struts, so every
+    line box keeps its size, and return each line's (x, y, font size), y being
+    the line centre, in page inches
+    """
+    markers = {name: marker for name, (marker, _) in DATE_LINES.items()}
+    probe = {f"{name}_line": f"{PLACEHOLDER} {marker}" for name, marker in markers.items()}
+    if not compile_latex(cover_source(**probe), probe_pdf, timeout=10):
+        raise RuntimeError("LaTeX compilation of the cover probe failed")
     
-    # Create temporary LaTeX file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.tex', delete=False) as f:
-        f.write(latex_content)
-        tex_file = f.name
+    positions = {}
+    def visit(text, cm, tm, font_dict, font_size):
+        for name, marker in markers.items():
+            if name not in positions and text.strip().startswith(marker):
+                # Text origin in user space, then through the current matrix
+                x, y = tm[4], tm[5]
+                positions[name] = (cm[0] * x + cm[2] * y + cm[4], cm[1] * x + cm[3] * y + cm[5])
+    PdfReader(str(probe_pdf)).pages[0].extract_text(visitor_text=visit)
+    probe_pdf.unlink()
     
-    try:
-        # Compile LaTeX to PDF using pdflatex
-        result = subprocess.run([
-            'pdflatex',
-            '-interaction=nonstopmode',
-            '-output-directory=' + str(output_dir),
-            tex_file
-        ], capture_output=True, text=True, timeout=60)
-        
-        # Look for the generated PDF in the output directory
-        generated_pdf = output_dir / Path(tex_file).with_suffix('.pdf').name
-        if generated_pdf.exists():
-            generated_pdf.rename(pdf_path)
-            print(f"✅ Cover page generated: {pdf_path}")
-            return str(pdf_path)
-        else:
-            print(f"❌ LaTeX compilation failed: {result.stderr}")
-            return generate_simple_cover_page()
-            
-    except Exception as e:
-        print(f"❌ LaTeX generation failed: {e}")
-        return generate_simple_cover_page()
-    finally:
-        # Clean up temporary files
-        try:
-            Path(tex_file).unlink()
-            aux_file = Path(tex_file).with_suffix('.aux')
-            log_file = Path(tex_file).with_suffix('.log')
-            if aux_file.exists():
-                aux_file.unlink()
-            if log_file.exists():
-                log_file.unlink()
-        except:
-            pass
-
-def generate_simple_cover_page():
-    """Fallback simple cover page generation"""
-    output_dir = Path(__file__).parent / "output"
+    missing = set(markers) - set(positions)
+    if missing:
+        raise RuntimeError(f"Could not find the cover's {', '.join(sorted(missing))} line")
+    # Baselines in points -> line centres in inches, as stamp_page expects
+    sizes = {name: size for name, (_, size) in DATE_LINES.items()}
+    return {name: (x / 72, (y + sizes[name] * 0.35) / 72, sizes[name])
+            for name, (x, y) in positions.items()}
+
+def generate_cover_page():
+    """Generate a professional cover page using LaTeX formatting like the J1 Journal 1"""
+    
+    output_dir = OUTPUT_DIR
     output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     
-    # Simple text file as fallback
-    text_path = output_dir / f"cover_page_{timestamp}.txt"
+    # Generate PDF
+    pdf_path = output_dir / f"cover_page_{timestamp}.pdf"
     
-    content = f"""
-================================================================================
-REPORT
-================================================================================
-
-Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-Module: 00.00 - Cover
-
-Author: Michael Logan Maloney
-Position: PhD Student
-Institution: Pennsylvania State University
-Department: Architectural Engineering
-Laboratory: Sustainable Buildings and Societies Laboratory (SBS Lab)
-Advisor: Dr. Wangda Zuo
-
-Report Generated on {datetime.now().strftime("%B %d, %Y at %I:%M %p")}
-"""
+    latex_content = cover_source(date_line=PLACEHOLDER, timestamp_line=PLACEHOLDER)
     
-    with open(text_path, 'w') as f:
-        f.write(content)
+    # Reuse the compiled cover and its date line positions while the LaTeX
+    # source is unchanged; the positions are written last, so their presence
+    # means both compiles finished
+    key = hashlib.sha256(latex_content.encode()).hexdigest()[:16]
+    cached_pdf = CACHE_DIR / f"cover_page_{key}.pdf"
+    positions_file = CACHE_DIR / f"cover_page_{key}.json"
+    if not positions_file.exists():
+        positions = locate_date_lines(CACHE_DIR / f"cover_probe_{key}.pdf")
+        # The cover compiles in well under a second; a long hang is a bug to surface
+        if not compile_latex(latex_content, cached_pdf, timeout=10):
+            raise RuntimeError("LaTeX compilation of the cover page failed")
+        positions_file.write_text(json.dumps(positions))
+    lines = json.loads(positions_file.read_text())
     
-    print(f"✅ Simple cover page generated: {text_path}")
-    return str(text_path)
+    # Stamp the run's date lines onto the cached page
+    stamp_page(cached_pdf, [
+        (*lines['date'], False, 'black', f"Report Generated on {now.strftime('%B %d, %Y at %I:%M %p')}"),
+        (*lines['timestamp'], False, 'black', f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}"),
+    ], pdf_path, fonts=("Times-Italic", "Times-BoldItalic"), frame=PAGE_FRAME)
+    print(f"✅ Cover page generated: {pdf_path}")
+    return str(pdf_path)
 
 def main():
     """Main function to generate cover page"""
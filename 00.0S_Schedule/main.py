@@ -11,19 +11,27 @@ Schedule module with Google Spreadsheet integration.
 Downloads spreadsheet, converts to PDF, then to JPG, and inserts into document.
 """
 
+import os
 import sys
+import json
+import shutil
+import hashlib
 from datetime import datetime
 from pathlib import Path
+import matplotlib
+matplotlib.use('Agg')  # headless: skip GUI backend probing
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
 from PIL import Image
-import warnings
 import requests
-import pandas as pd
-import io
-import base64
-from pdf2image import convert_from_path
-warnings.filterwarnings('ignore')
+import pypdfium2 as pdfium
+
+# Add shared J1 helpers to path
+sys.path.append(str(Path(__file__).parent / ".."))
+from modules.pdf_canvas import stamp_page, IMAGE_AXES_FRAME
+
+# Rendered schedule pages without the timestamp, keyed by content hash
+CACHE_DIR = Path(__file__).parent / ".cache"
 
 def download_google_spreadsheet_as_pdf():
     """Download Google Spreadsheet as PDF"""
@@ -37,18 +45,41 @@ def download_google_spreadsheet_as_pdf():
     # Convert to PDF download URL
     pdf_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export?format=pdf"
     
+    # Save PDF to downloads directory
+    downloads_dir = Path(__file__).parent / ".." / "downloads"
+    pdf_path = downloads_dir / "00.0S_schedule.pdf"
+    meta_path = downloads_dir / ".00.0S_schedule.meta.json"
+    
     try:
-        # Download the PDF
-        response = requests.get(pdf_url)
-        response.raise_for_status()
-        
-        # Save PDF to downloads directory
-        downloads_dir = Path(__file__).parent / ".." / "downloads"
-        downloads_dir.mkdir(exist_ok=True)
+        # Conditional GET: send the validators from the last download so an
+        # unchanged spreadsheet comes back as a bodiless 304
+        headers = {}
+        if pdf_path.exists() and meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
         
-        pdf_path = downloads_dir / "00.0S_schedule.pdf"
-        with open(pdf_path, 'wb') as f:
-            f.write(response.content)
+        # Download the PDF, streaming it to disk; it only replaces the cached
+        # copy once complete, and the validators are written after that, so an
+        # interrupted download never leaves a truncated file a 304 would keep
+        with requests.get(pdf_url, headers=headers, stream=True, timeout=30) as response:
+            if response.status_code == 304:
+                print(f"✅ Schedule PDF unchanged, using cached copy: {pdf_path}")
+                return pdf_path
+            response.raise_for_status()
+            
+            downloads_dir.mkdir(exist_ok=True)
+            response.raw.decode_content = True  # undo any gzip transfer encoding
+            tmp_path = pdf_path.with_suffix('.pdf.part')
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=64 * 1024)
+            os.replace(tmp_path, pdf_path)
+            meta_path.write_text(json.dumps({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }))
         
         print(f"✅ Downloaded schedule PDF: {pdf_path}")
         return pdf_path
@@ -60,17 +91,20 @@ def download_google_spreadsheet_as_pdf():
 def convert_pdf_to_jpg(pdf_path):
     """Convert PDF to JPG image"""
     
+    # Reuse the JPG if it was rendered from this (or a newer) copy of the PDF
+    jpg_path = pdf_path.parent / "00.0S_schedule.jpg"
+    if jpg_path.exists() and jpg_path.stat().st_mtime > pdf_path.stat().st_mtime:
+        print(f"✅ Schedule JPG up to date: {jpg_path}")
+        return jpg_path
+    
     try:
-        # Convert PDF to images using pdf2image
-        images = convert_from_path(pdf_path, dpi=150)
-        
-        if images:
-            # Take the first page
-            image = images[0]
+        # Render the first page in-process with PDFium (no Poppler subprocess)
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        if len(pdf) > 0:
+            image = pdf[0].render(scale=150 / 72).to_pil()
             
-            # Save as JPG
-            jpg_path = pdf_path.parent / "00.0S_schedule.jpg"
-            image.save(jpg_path, 'JPEG', quality=95)
+            # Save as JPG; it is re-encoded when embedded, so favour size
+            image.save(jpg_path, 'JPEG', quality=85, optimize=True)
             
             print(f"✅ Converted PDF to JPG: {jpg_path}")
             return jpg_path
@@ -80,7 +114,9 @@ def convert_pdf_to_jpg(pdf_path):
         
     except Exception as e:
         print(f"❌ Error converting PDF to JPG: {e}")
-        # Fallback to placeholder image
+        # Fallback to placeholder image, kept apart from the converted JPG so
+        # the up-to-date check above never mistakes it for the schedule
+        fallback_path = pdf_path.parent / "00.0S_schedule_fallback.jpg"
         try:
             fig, ax = plt.subplots(figsize=(8, 6))
             ax.text(0.5, 0.5, 'Schedule Spreadsheet\n(PDF Conversion Failed)', 
@@ -90,12 +126,11 @@ def convert_pdf_to_jpg(pdf_path):
             ax.axis('off')
             
             # Save as JPG
-            jpg_path = pdf_path.parent / "00.0S_schedule.jpg"
-            plt.savefig(jpg_path, dpi=150, bbox_inches='tight', format='jpg')
+            plt.savefig(fallback_path, dpi=150, bbox_inches='tight', format='jpg')
             plt.close()
             
-            print(f"⚠️ Created fallback JPG: {jpg_path}")
-            return jpg_path
+            print(f"⚠️ Created fallback JPG: {fallback_path}")
+            return fallback_path
             
         except Exception as fallback_error:
             print(f"❌ Error creating fallback image: {fallback_error}")
@@ -106,7 +141,8 @@ def generate_schedule_page():
     
     output_dir = Path(__file__).parent / "output"
     output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     
     # Download spreadsheet as PDF and convert to JPG
     pdf_path = download_google_spreadsheet_as_pdf()
@@ -115,6 +151,28 @@ def generate_schedule_page():
     else:
         jpg_path = None
     
+    # The page content depends only on this module's code and the schedule
+    # image, so render it once per (code, image) pair and reuse it
+    content = hashlib.sha256(Path(__file__).read_bytes())
+    if jpg_path and jpg_path.exists():
+        content.update(jpg_path.read_bytes())
+    cached_pdf = CACHE_DIR / f"schedule_00.0S_{content.hexdigest()[:16]}.pdf"
+    if not cached_pdf.exists():
+        render_schedule_content(jpg_path, cached_pdf)
+    
+    # Timestamp - left justified, stamped onto the cached page
+    timestamp_text = f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}"
+    output_file = output_dir / f"schedule_00.0S_{timestamp}.pdf"
+    stamp_page(cached_pdf, [(0.1, 0.6, 10, False, 'gray', timestamp_text)], output_file,
+               frame=IMAGE_AXES_FRAME)
+    
+    print(f"✅ Schedule page generated: {output_file}")
+    return str(output_file)
+
+def render_schedule_content(jpg_path, output_file):
+    """Render the timestamp-free schedule page to output_file"""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    
     # Google Spreadsheet link
     spreadsheet_link = "https://docs.google.com/spreadsheets/d/1IGyQ-Jq-aq6kek80Q1rGnb0eoOUqBPVSolDzVZdJI-s/edit?usp=sharing"
     
@@ -122,6 +180,9 @@ def generate_schedule_page():
     fig, ax = plt.subplots(figsize=(8.5, 11), facecolor='white')
     ax.set_xlim(0, 8.5)
     ax.set_ylim(0, 11)
+    # Equal aspect, as imshow leaves it, even on the placeholder page, so the
+    # axes always sits in IMAGE_AXES_FRAME and the stamped timestamp lines up
+    ax.set_aspect('equal')
     ax.axis('off')
     
     # Title - Left justified with book-style spacing
@@ -132,8 +193,15 @@ def generate_schedule_page():
     # Add the Schedule image - prominently displayed with book-style spacing
     if jpg_path and jpg_path.exists():
         try:
+            # Shrink to what the page can show (8 in at the 150 DPI save) so
+            # surplus pixels never reach matplotlib or the embedded PDF image
+            target_px = int(8.0 * 150)
             img = Image.open(jpg_path)
-            
+            img.draft('RGB', (target_px, target_px))  # libjpeg scaled IDCT decode
+            img.load()
+            img.thumbnail((target_px, target_px), Image.LANCZOS)
+            img = img.convert('RGB')
+
             # Calculate optimal size to fit page width with margins
             img_width = 8.0  # Much larger to fill page width
             aspect_ratio = img.height / img.width
@@ -191,25 +259,20 @@ def generate_schedule_page():
     ax.text(4.25, 0.8, "3", fontsize=14, fontweight='normal',
             ha='center', va='center', fontfamily='Arial', color='black')
     
-    # Timestamp - left justified
-    timestamp_text = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    ax.text(0.1, 0.6, timestamp_text, fontsize=10, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='gray')
-    
     # Module identifier - left justified
     module_text = "Module: 00.0S - Schedule"
     ax.text(0.1, 0.4, module_text, fontsize=10, fontweight='normal',
             ha='left', va='center', fontfamily='Arial', color='gray')
     
-    # Save as PDF
-    output_file = output_dir / f"schedule_00.0S_{timestamp}.pdf"
-    with PdfPages(output_file) as pdf:
-        pdf.savefig(fig, dpi=300)
-    
-    plt.close()
-    
-    print(f"✅ Schedule page generated: {output_file}")
-    return str(output_file)
+    # Save as PDF; text stays vector, so the dpi only sets the image
+    # resolution - match the 150 DPI the spreadsheet is rendered at. Render
+    # beside the cache entry and rename it into place, so an interrupted run
+    # never leaves a half-written page under a valid key
+    tmp_file = output_file.with_suffix('.pdf.part')
+    with PdfPages(tmp_file) as pdf:
+        pdf.savefig(fig, dpi=150)
+    plt.close(fig)
+    os.replace(tmp_file, output_file)
 
 def main():
     """Main function to generate Schedule page"""
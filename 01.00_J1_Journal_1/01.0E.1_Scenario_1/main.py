@@ -13,29 +13,30 @@ Scenario 1 analysis and results.
 import sys
 from datetime import datetime
 from pathlib import Path
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
-import numpy as np
-import warnings
-warnings.filterwarnings('ignore')
+
+# Resolve this module's directories once at import
+MODULE_DIR = Path(__file__).resolve().parent
+OUTPUT_DIR = MODULE_DIR / "output"
+
+# Add shared J1 helpers to path
+sys.path.append(str(MODULE_DIR.parent.parent))
+from modules.pdf_canvas import new_canvas, draw_text_block, page_chrome
 
 def generate_scenario_1():
     """Generate Scenario 1 analysis"""
     
-    output_dir = Path(__file__).parent / "output"
+    output_dir = OUTPUT_DIR
     output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     
-    # Create figure with professional styling
-    fig, ax = plt.subplots(figsize=(8.5, 11), facecolor='white')
-    ax.set_xlim(0, 8.5)
-    ax.set_ylim(0, 11)
-    ax.axis('off')
+    # Text-only page, drawn directly on a ReportLab canvas
+    output_file = output_dir / f"scenario_1_01.0E.1_{timestamp}.pdf"
+    c = new_canvas(output_file)
     
     # Title
     title_text = "Scenario 1 Analysis"
-    ax.text(4.25, 10, title_text, fontsize=18, fontweight='bold', 
-            ha='center', va='center', fontfamily='Arial', color='black')
+    entries = [(4.25, 10, 18, True, 'black', title_text, 'center')]
     
     # Description
     description = [
@@ -54,8 +55,7 @@ def generate_scenario_1():
     # Position description
     for i, line in enumerate(description):
         y_pos = 8.5 - (i * 0.4)
-        ax.text(4.25, y_pos, line, fontsize=11, fontweight='normal', 
-                ha='center', va='center', fontfamily='Arial', color='black')
+        entries.append((4.25, y_pos, 11, False, 'black', line, 'center'))
     
     # Placeholder for future analysis
     placeholder = [
@@ -69,29 +69,15 @@ def generate_scenario_1():
     
     for i, line in enumerate(placeholder):
         y_pos = 4.5 - (i * 0.3)
-        ax.text(4.25, y_pos, line, fontsize=10, fontweight='normal',
-                ha='center', va='center', fontfamily='Arial', color='gray')
-    
-    # Page number
-    ax.text(4.25, 0.5, "1", fontsize=14, fontweight='normal',
-            ha='center', va='center', fontfamily='Arial', color='black')
+        entries.append((4.25, y_pos, 10, False, 'gray', line, 'center'))
     
-    # Timestamp
-    timestamp_text = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    ax.text(1, 0.3, timestamp_text, fontsize=10, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='gray')
-    
-    # Module identifier
-    module_text = "Module: 01.0E.1 - Scenario_1"
-    ax.text(1, 0.1, module_text, fontsize=10, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='gray')
+    # Page number, timestamp and module identifier
+    entries += page_chrome("1", "Module: 01.0E.1 - Scenario_1", now, x=1)
     
     # Save as PDF
-    output_file = output_dir / f"scenario_1_01.0E.1_{timestamp}.pdf"
-    with PdfPages(output_file) as pdf:
-        pdf.savefig(fig, dpi=300, bbox_inches='tight')
-    
-    plt.close()
+    draw_text_block(c, entries)
+    c.showPage()
+    c.save()
     
     print(f"✅ Scenario 1 generated: {output_file}")
     return str(output_file)
@@ -8,209 +8,36 @@ PhD Student - Penn State Architectural Engineering Department
 Mechanical System Focus
 
 Scenario Library module with Google Spreadsheet integration.
-Downloads spreadsheet, converts to PDF, then to JPG, and inserts into document.
+Downloads the spreadsheet as PDF and inserts its first page into the document.
 """
 
 import sys
-from datetime import datetime
 from pathlib import Path
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
-from PIL import Image
-import warnings
-import requests
-import pandas as pd
-import io
-import base64
-from pdf2image import convert_from_path
-warnings.filterwarnings('ignore')
 
-def download_google_spreadsheet_as_pdf():
-    """Download Google Spreadsheet as PDF - like Schedule module"""
-    
-    # Google Spreadsheet URL
-    spreadsheet_url = "https://docs.google.com/spreadsheets/d/1q_i0d0X4bdCIv_1Cr6pmbcj4iRqMcsYiPjCxK62E1cA/edit?gid=1793100996#gid=1793100996"
-    
-    # Extract the spreadsheet ID from the URL
-    spreadsheet_id = "1q_i0d0X4bdCIv_1Cr6pmbcj4iRqMcsYiPjCxK62E1cA"
-    
-    # Convert to PDF download URL targeting scenario_library tab with correct gid
-    gid = "1793100996"  # This is the correct gid for the scenario_library tab
-    pdf_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export?format=pdf&gid={gid}"
-    
-    try:
-        # Download the PDF
-        response = requests.get(pdf_url)
-        response.raise_for_status()
-        
-        # Save PDF to downloads directory
-        downloads_dir = Path(__file__).parent / ".." / ".." / "downloads"
-        downloads_dir.mkdir(exist_ok=True)
-        
-        pdf_path = downloads_dir / "01.0F_scenario_library.pdf"
-        with open(pdf_path, 'wb') as f:
-            f.write(response.content)
-        
-        print(f"✅ Downloaded scenario library PDF: {pdf_path}")
-        return pdf_path
-        
-    except Exception as e:
-        print(f"❌ Error downloading spreadsheet as PDF: {e}")
-        return None
-
-def convert_pdf_to_jpg(pdf_path):
-    """Convert PDF to JPG image"""
-    
-    try:
-        # Convert PDF to images using pdf2image
-        images = convert_from_path(pdf_path, dpi=150)
-        
-        if images:
-            # Take the first page
-            image = images[0]
-            
-            # Save as JPG
-            jpg_path = pdf_path.parent / "01.0F_scenario_library.jpg"
-            image.save(jpg_path, 'JPEG', quality=95)
-            
-            print(f"✅ Converted PDF to JPG: {jpg_path}")
-            return jpg_path
-        else:
-            print("❌ No pages found in PDF")
-            return None
-        
-    except Exception as e:
-        print(f"❌ Error converting PDF to JPG: {e}")
-        # Fallback to placeholder image
-        try:
-            fig, ax = plt.subplots(figsize=(8, 6))
-            ax.text(0.5, 0.5, 'Scenario Library Spreadsheet\n(PDF Conversion Failed)', 
-                    ha='center', va='center', fontsize=16, transform=ax.transAxes)
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            
-            # Save as JPG
-            jpg_path = pdf_path.parent / "01.0F_scenario_library.jpg"
-            plt.savefig(jpg_path, dpi=150, bbox_inches='tight', format='jpg')
-            plt.close()
-            
-            print(f"⚠️ Created fallback JPG: {jpg_path}")
-            return jpg_path
-            
-        except Exception as fallback_error:
-            print(f"❌ Error creating fallback image: {fallback_error}")
-            return None
+# Resolve this module's directory once at import
+MODULE_DIR = Path(__file__).resolve().parent
+
+# Add shared J1 helpers to path
+sys.path.append(str(MODULE_DIR.parent.parent))
+from modules.spreadsheet_page import SpreadsheetPageSpec, render
+
+SPEC = SpreadsheetPageSpec(
+    module_dir=MODULE_DIR,
+    module_id="01.0F",
+    title="Scenario Library",
+    tab="scenario_library",
+    spreadsheet_id="1q_i0d0X4bdCIv_1Cr6pmbcj4iRqMcsYiPjCxK62E1cA",
+    gid="1793100996",  # This is the correct gid for the scenario_library tab
+    spreadsheet_link="https://docs.google.com/spreadsheets/d/1q_i0d0X4bdCIv_1Cr6pmbcj4iRqMcsYiPjCxK62E1cA/edit?gid=1793100996#gid=1793100996",
+    table_label="Table 1",
+    caption="Scenario library data from Google Spreadsheet.",
+    page_number="9",
+    output_name="scenario_library",
+)
 
 def generate_scenario_library_page():
     """Generate Scenario Library page with integrated Google Spreadsheet"""
-    
-    output_dir = Path(__file__).parent / "output"
-    output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Download spreadsheet as PDF and convert to JPG - like Schedule module
-    pdf_path = download_google_spreadsheet_as_pdf()
-    if pdf_path:
-        jpg_path = convert_pdf_to_jpg(pdf_path)
-    else:
-        jpg_path = None
-    
-    # Google Spreadsheet link
-    spreadsheet_link = "https://docs.google.com/spreadsheets/d/1q_i0d0X4bdCIv_1Cr6pmbcj4iRqMcsYiPjCxK62E1cA/edit?gid=1793100996#gid=1793100996"
-    
-    # Create figure with professional styling
-    fig, ax = plt.subplots(figsize=(8.5, 11), facecolor='white')
-    ax.set_xlim(0, 8.5)
-    ax.set_ylim(0, 11)
-    ax.axis('off')
-    
-    # Title - Left justified with book-style spacing
-    title_text = "Scenario Library"
-    ax.text(0.1, 9.9, title_text, fontsize=18, fontweight='bold', 
-            ha='left', va='center', fontfamily='Arial', color='black')
-    
-    # Add the Scenario Library image - prominently displayed with book-style spacing
-    if jpg_path and jpg_path.exists():
-        try:
-            img = Image.open(jpg_path)
-            
-            # Calculate optimal size to fit page width with margins
-            img_width = 8.0  # Much larger to fill page width
-            aspect_ratio = img.height / img.width
-            img_height = img_width * aspect_ratio
-            
-            # Ensure image doesn't exceed available vertical space
-            max_height = 7.0  # Much larger to fill page height
-            if img_height > max_height:
-                img_height = max_height
-                img_width = img_height / aspect_ratio
-            
-            # Position image to fill most of the page
-            x_pos = 0.25  # Small left margin
-            # Position image closer to title to reduce whitespace
-            y_pos = 2.0  # Fixed position near bottom
-            
-            # Add image
-            ax.imshow(img, extent=[x_pos, x_pos + img_width, y_pos, y_pos + img_height])
-            
-            # Figure number - clean and simple with reduced spacing
-            ax.text(0.1, y_pos - 0.5, "Table 1", fontsize=14, fontweight='bold',
-                    ha='left', va='center', fontfamily='Arial', color='black')
-            
-            # Small one-sentence description with reduced spacing
-            ax.text(0.1, y_pos - 0.8, "Scenario library data from Google Spreadsheet.", 
-                    fontsize=12, fontweight='normal', ha='left', va='center', 
-                    fontfamily='Arial', color='black')
-            
-            # Google Spreadsheet link - small and clean with reduced spacing
-            ax.text(0.1, y_pos - 1.1, "Source: Google Spreadsheet (scenario_library tab)", fontsize=9, fontweight='normal',
-                    ha='left', va='center', fontfamily='Arial', color='blue',
-                    url=spreadsheet_link, bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.7))
-            
-        except Exception as e:
-            print(f"⚠️ Warning: Could not load scenario library image: {e}")
-            # Add placeholder text with book spacing
-            ax.text(0.1, 6, "Scenario Library Spreadsheet", fontsize=14, fontweight='bold',
-                    ha='left', va='center', fontfamily='Arial', color='gray')
-            ax.text(0.1, 5.5, "(Scenario Library will be integrated from Google Spreadsheet)", fontsize=10,
-                    ha='left', va='center', fontfamily='Arial', color='gray')
-            ax.text(0.1, 5.2, f"Source: {spreadsheet_link}", fontsize=9, fontweight='normal',
-                    ha='left', va='center', fontfamily='Arial', color='blue',
-                    url=spreadsheet_link, bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.7))
-    else:
-        # Add placeholder text with book spacing
-        ax.text(0.1, 6, "Scenario Library Spreadsheet", fontsize=14, fontweight='bold',
-                ha='left', va='center', fontfamily='Arial', color='gray')
-        ax.text(0.1, 5.5, "(Scenario Library will be integrated from Google Spreadsheet)", fontsize=10,
-                ha='left', va='center', fontfamily='Arial', color='gray')
-        ax.text(0.1, 5.2, f"Source: {spreadsheet_link}", fontsize=9, fontweight='normal',
-                ha='left', va='center', fontfamily='Arial', color='blue',
-                url=spreadsheet_link, bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.7))
-    
-    # Page number - centered
-    ax.text(4.25, 0.8, "9", fontsize=14, fontweight='normal',
-            ha='center', va='center', fontfamily='Arial', color='black')
-    
-    # Timestamp - left justified
-    timestamp_text = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    ax.text(0.1, 0.6, timestamp_text, fontsize=10, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='gray')
-    
-    # Module identifier - left justified
-    module_text = "Module: 01.0F - Scenario Library"
-    ax.text(0.1, 0.4, module_text, fontsize=10, fontweight='normal',
-            ha='left', va='center', fontfamily='Arial', color='gray')
-    
-    # Save as PDF
-    output_file = output_dir / f"scenario_library_01.0F_{timestamp}.pdf"
-    with PdfPages(output_file) as pdf:
-        pdf.savefig(fig, dpi=300)
-    
-    plt.close()
-    
-    print(f"✅ Scenario Library page generated: {output_file}")
-    return str(output_file)
+    return render(SPEC)
 
 def main():
     """Main function to generate Scenario Library page"""
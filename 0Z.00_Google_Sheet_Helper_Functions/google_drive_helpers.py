@@ -13,24 +13,32 @@ This module provides reusable functions for:
 
 import os
 import re
+import hashlib
+import threading
 import requests
 import json
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Union
 import gspread
 from google.oauth2.service_account import Credentials
 from PIL import Image
 import io
 
+# Shared downloads folder at the repo root, where modules look for their assets
+# whatever directory they are run from
+DOWNLOAD_DIR = Path(__file__).resolve().parent.parent / "downloads"
+
 class GoogleDriveHelpers:
     """Comprehensive Google Drive helper functions for J1 system"""
     
     def __init__(self, credentials_path: str = "credentials/google_sheets_credentials.json"):
         self.credentials_path = Path(credentials_path)
-        self.download_dir = Path("downloads")
+        self.download_dir = DOWNLOAD_DIR
         self.download_dir.mkdir(exist_ok=True)
         self.assets_db_file = self.download_dir / "assets_database.json"
+        self._db_lock = threading.Lock()
         self.load_assets_database()
         
     def load_assets_database(self):
@@ -50,9 +58,17 @@ class GoogleDriveHelpers:
     
     def save_assets_database(self):
         """Save assets database"""
-        self.assets_db['metadata']['last_updated'] = datetime.now().isoformat()
-        with open(self.assets_db_file, 'w') as f:
-            json.dump(self.assets_db, f, indent=2)
+        # prefetch_assets saves from several threads; the shallow copy of the
+        # assets dict is atomic, so the dump never sees it change mid-iteration
+        with self._db_lock:
+            self.assets_db['metadata']['last_updated'] = datetime.now().isoformat()
+            snapshot = {**self.assets_db, 'assets': dict(self.assets_db['assets'])}
+            # Module processes may save concurrently; write a private temp file
+            # and swap it in so no reader ever sees a half-written database
+            tmp_file = self.assets_db_file.with_name(f".{self.assets_db_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(snapshot, f, indent=2)
+            os.replace(tmp_file, self.assets_db_file)
     
     def extract_drive_id(self, url: str) -> Optional[str]:
         """Extract Google Drive ID from various URL formats"""
@@ -95,8 +111,18 @@ class GoogleDriveHelpers:
             print(f"❌ Could not extract Drive ID from: {url}")
             return None
         
-        # Always download fresh content for drawings (no caching)
-        print(f"🔄 Downloading fresh drawing content for {drive_id}")
+        if not filename:
+            filename = f"drawing_{drive_id}.png"
+        
+        file_path = self.download_dir / filename
+        meta_path = self.download_dir / f".{filename}.meta.json"
+        
+        # The orchestrator fetched the drawings up front and lists the ones it
+        # got; module runs just pick up that copy instead of asking Google again
+        prefetched = os.environ.get('J1_ASSETS_PREFETCHED', '').split(os.pathsep)
+        if filename in prefetched and file_path.exists():
+            print(f"✅ Using prefetched drawing: {file_path}")
+            return file_path
         
         # Google Drawing export URL
         export_url = f"https://docs.google.com/drawings/d/{drive_id}/export/png"
@@ -114,18 +140,42 @@ class GoogleDriveHelpers:
                 'Upgrade-Insecure-Requests': '1'
             }
             
+            # Conditional GET: send the validators from the last download so an
+            # unchanged drawing comes back as a bodiless 304
+            meta = {}
+            if file_path.exists() and meta_path.exists():
+                meta = json.loads(meta_path.read_text())
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+            
             # Follow redirects and use proper timeout
+            print(f"🔄 Checking drawing content for {drive_id}")
             response = requests.get(export_url, headers=headers, timeout=30, allow_redirects=True)
+            if response.status_code == 304:
+                print(f"✅ Drawing unchanged, using cached copy: {file_path}")
+                return file_path
             response.raise_for_status()
             
-            if not filename:
-                filename = f"drawing_{drive_id}.png"
+            new_meta = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'sha256': hashlib.sha256(response.content).hexdigest(),
+            }
             
-            file_path = self.download_dir / filename
+            # Drawing exports often carry no validators, so also compare the
+            # bytes: an identical export leaves the file and its mtime alone,
+            # which keeps page caches keyed on the asset valid
+            if file_path.exists() and meta.get('sha256') == new_meta['sha256']:
+                meta_path.write_text(json.dumps(new_meta))
+                print(f"✅ Drawing unchanged, using cached copy: {file_path}")
+                return file_path
             
             # Save file
             with open(file_path, 'wb') as f:
                 f.write(response.content)
+            meta_path.write_text(json.dumps(new_meta))
             
             # Update database
             self.assets_db['assets'][drive_id] = {
@@ -314,6 +364,14 @@ class GoogleDriveHelpers:
             print(f"⚠️ Unsupported file type: {file_type}")
             return None
     
+    def prefetch_assets(self, assets: List[Tuple[str, str, str]], max_workers: int = 8) -> Dict[str, Optional[Path]]:
+        """Download (module_id, url, filename) assets concurrently, keyed by module_id"""
+        # Each download is one independent HTTPS round trip, so overlap them
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {module_id: executor.submit(self.download_asset, url, module_id, filename)
+                       for module_id, url, filename in assets}
+        return {module_id: future.result() for module_id, future in futures.items()}
+    
     def get_asset_info(self, drive_id: str) -> Optional[Dict]:
         """Get information about a downloaded asset"""
         return self.assets_db['assets'].get(drive_id)
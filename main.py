@@ -19,10 +19,15 @@ Stage: Advanced Research - Building Foundation for 4-Year PhD Journey
 
 import os
 import sys
+import io
 import subprocess
 import yaml
 import json
 import re
+import runpy
+import traceback
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import warnings
@@ -30,12 +35,43 @@ warnings.filterwarnings('ignore')
 
 # Import for PDF and image processing
 try:
+    import matplotlib
+    matplotlib.use('Agg')  # headless: select the backend before pyplot probes GUI ones
     import matplotlib.pyplot as plt
     from matplotlib.backends.backend_pdf import PdfPages
     from PIL import Image as PILImage
 except ImportError as e:
     print(f"⚠️ Warning: Some dependencies not available: {e}")
 
+# Modules with no inter-module data dependency: each reads only its own inputs
+# (module_inputs.json, its spreadsheet or prefetched drawing) and writes to its
+# own output/ directory, so they can be generated concurrently
+CONCURRENT_MODULE_IDS = ('00.00', '00.0A', '00.0B', '00.0S', '01.0A', '01.0B', '01.0D', '01.0E', '01.0F', '01.0G', '01.0E.1')
+
+def warm_worker():
+    """Pool initializer: import the rendering stack once per worker process so
+    every module run in that worker reuses it instead of paying a cold start"""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot  # noqa: F401 - builds the font cache
+        from reportlab.pdfgen import canvas  # noqa: F401
+    except ImportError:
+        pass
+
+def run_module(module_path: str) -> tuple:
+    """Run a module's main.py inside a pool worker and return (success, output)"""
+    output = io.StringIO()
+    os.chdir(module_path)
+    try:
+        with contextlib.redirect_stdout(output):
+            runpy.run_path(str(Path(module_path) / "main.py"), run_name="__main__")
+        return True, output.getvalue()
+    except SystemExit as e:
+        return e.code in (0, None), output.getvalue()
+    except Exception:
+        return False, output.getvalue() + traceback.format_exc()
+
 class J1PhDStudyOrchestrator:
     """J1 PhD Dissertation Notebook - Main Orchestrator for Advanced Research"""
     
@@ -184,31 +220,9 @@ class J1PhDStudyOrchestrator:
                 )
                 
                 if result.returncode == 0:
-                    print(f"✅ J1 module {module_id} completed successfully")
-                    
-                    # Find generated PDFs
-                    output_dir = module_path / "output"
-                    pdf_files = []
-                    if output_dir.exists():
-                        pdf_files = list(output_dir.glob("*.pdf"))
-                        if pdf_files:
-                            print(f"   📄 Found {len(pdf_files)} PDF(s): {[f.name for f in pdf_files]}")
-                    
-                    return {
-                        'success': True,
-                        'output': result.stdout,
-                        'pdf_files': pdf_files,
-                        'module_id': module_id,
-                        'module_name': module_info['name']
-                    }
+                    return self.build_module_result(module_id, module_info, True, result.stdout)
                 else:
-                    print(f"❌ J1 module {module_id} failed: {result.stderr}")
-                    return {
-                        'success': False,
-                        'error': result.stderr,
-                        'module_id': module_id,
-                        'module_name': module_info['name']
-                    }
+                    return self.build_module_result(module_id, module_info, False, result.stderr)
             else:
                 print(f"⚠️ Could not find main.py for module {module_id}")
                 return {
@@ -227,6 +241,64 @@ class J1PhDStudyOrchestrator:
                 'module_name': module_info['name']
             }
     
+    def build_module_result(self, module_id: str, module_info: dict, success: bool, output: str) -> dict:
+        """Build the result record for an executed module"""
+        if not success:
+            print(f"❌ J1 module {module_id} failed: {output}")
+            return {
+                'success': False,
+                'error': output,
+                'module_id': module_id,
+                'module_name': module_info['name']
+            }
+        
+        print(f"✅ J1 module {module_id} completed successfully")
+        
+        # Find generated PDFs
+        output_dir = self.base_dir / module_info['path'] / "output"
+        pdf_files = []
+        if output_dir.exists():
+            pdf_files = list(output_dir.glob("*.pdf"))
+            if pdf_files:
+                print(f"   📄 Found {len(pdf_files)} PDF(s): {[f.name for f in pdf_files]}")
+        
+        return {
+            'success': True,
+            'output': output,
+            'pdf_files': pdf_files,
+            'module_id': module_id,
+            'module_name': module_info['name']
+        }
+    
+    def execute_concurrent_j1_modules(self, modules: dict) -> dict:
+        """Execute independent J1 modules concurrently in a process pool"""
+        results = {}
+        futures = {}
+        if not modules:
+            return results
+        
+        print(f"⚡ Executing {len(modules)} independent J1 modules concurrently: {', '.join(modules)}")
+        with ProcessPoolExecutor(max_workers=min(len(modules), os.cpu_count() or 1),
+                                 initializer=warm_worker) as executor:
+            for module_id, module_info in modules.items():
+                module_path = self.base_dir / module_info['path']
+                if not (module_path / "main.py").exists():
+                    results[module_id] = self.execute_j1_module(module_id, module_info)
+                    continue
+                
+                print(f"🚀 Executing J1 module {module_id}: {module_info['name']}")
+                self.clean_module_output_directory(module_path)
+                futures[module_id] = executor.submit(run_module, str(module_path))
+            
+            for module_id, future in futures.items():
+                try:
+                    success, output = future.result()
+                except Exception as e:
+                    success, output = False, str(e)
+                results[module_id] = self.build_module_result(module_id, modules[module_id], success, output)
+        
+        return results
+    
     def collect_all_pdfs(self):
         """Collect the most recent PDF from each module"""
         all_pdfs = []
@@ -811,6 +883,11 @@ class J1PhDStudyOrchestrator:
         active_modules = {k: v for k, v in self.module_config.items() if v.get('active', False)}
         print(f"📊 Found {len(active_modules)} active modules out of {len(self.module_config)} total modules")
         
+        # Independent modules run up front in a process pool
+        concurrent_results = self.execute_concurrent_j1_modules(
+            {k: v for k, v in active_modules.items() if k in CONCURRENT_MODULE_IDS}
+        )
+        
         # Execute all active modules
         for module_id, module_info in active_modules.items():
             # Skip the main.py module to avoid infinite loop
@@ -821,7 +898,10 @@ class J1PhDStudyOrchestrator:
             print(f"\n📋 Processing J1 module {module_id}: {module_info['name']}")
             
             # Execute main module
-            result = self.execute_j1_module(module_id, module_info)
+            if module_id in concurrent_results:
+                result = concurrent_results[module_id]
+            else:
+                result = self.execute_j1_module(module_id, module_info)
             self.module_results[module_id] = result
             
             # Execute submodules if this is a container
@@ -872,7 +952,7 @@ class J1PhDStudyOrchestrator:
         try:
             # Import Google Drive helpers
             sys.path.append(str(Path(__file__).parent / "0Z.00_Google_Sheet_Helper_Functions"))
-            from google_drive_helpers import download_asset, get_asset_statistics
+            from google_drive_helpers import GoogleDriveHelpers, get_asset_statistics
             
             print("   🔄 Initializing Google Drive download system...")
             
@@ -882,33 +962,30 @@ class J1PhDStudyOrchestrator:
                 with open(module_inputs_file, 'r') as f:
                     module_data = json.load(f)
                 
-                downloaded_count = 0
+                # Look for Google Drive links in descriptions
+                assets = []
                 for module_id, module_info in module_data['modules'].items():
-                    description = module_info.get('description', '')
-                    
-                    # Look for Google Drive links in descriptions
-                    if 'https://docs.google.com' in description:
-                        # Extract URL from description
-                        import re
-                        url_match = re.search(r'https://docs\.google\.com/[^\s]+', description)
-                        if url_match:
-                            url = url_match.group(0)
-                            print(f"   📥 Downloading asset for {module_id}: {url}")
-                            
-                            # Download the asset
-                            asset_path = download_asset(
-                                url=url,
-                                module_id=module_id,
-                                filename=f"{module_id}_asset.png"
-                            )
-                            
-                            if asset_path:
-                                downloaded_count += 1
-                                print(f"   ✅ Downloaded: {asset_path}")
-                            else:
-                                print(f"   ❌ Failed to download for {module_id}")
+                    url_match = re.search(r'https://docs\.google\.com/[^\s]+', module_info.get('description', ''))
+                    if url_match:
+                        assets.append((module_id, url_match.group(0), f"{module_id}_asset.png"))
+                
+                # Fetch them all at once, before any module runs
+                print(f"   📥 Downloading {len(assets)} assets concurrently")
+                results = GoogleDriveHelpers().prefetch_assets(assets)
+                prefetched = []
+                for module_id, asset_path in results.items():
+                    if asset_path:
+                        prefetched.append(Path(asset_path).name)
+                        print(f"   ✅ Downloaded: {asset_path}")
+                    else:
+                        print(f"   ❌ Failed to download for {module_id}")
                 
+                downloaded_count = len(prefetched)
                 if downloaded_count > 0:
+                    # Module runs (subprocesses inherit the environment) reuse
+                    # the copies fetched this run; an asset that failed is not
+                    # listed, so its module retries rather than use a stale file
+                    os.environ['J1_ASSETS_PREFETCHED'] = os.pathsep.join(prefetched)
                     stats = get_asset_statistics()
                     print(f"   📊 Downloaded {downloaded_count} assets. Total: {stats['total_assets']}")
                 else:
@@ -0,0 +1,154 @@
+"""
+abstract.py
+Shared abstract page generator for the J1 system.
+Author: Michael Maloney
+PhD Student - Penn State Architectural Engineering Department
+
+Abstract modules (the J1 concept abstract, the SIMBUILD conference draft)
+describe their page with an `AbstractSpec` and hand it to `render`. The page is
+typeset from one LaTeX template, compiled once per distinct content and cached;
+each run only stamps its generation time onto the cached PDF. If LaTeX is not
+available a plain matplotlib page is drawn instead (see abstract_fallback.py,
+which is only imported on that path).
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from modules.latex import compile_latex, latex_environment
+from modules.pdf_canvas import stamp_page, PAGE_FRAME
+
+ABSTRACT_TEX = r"""
+\documentclass[12pt]{article}
+\usepackage[utf8]{inputenc}
+\usepackage[margin=1in]{geometry}
+\usepackage{times}
+\usepackage{enumitem}
+\usepackage{setspace}
+\usepackage{color}
+
+\doublespacing
+
+\begin{document}
+
+\begin{center}
+\Large\textbf{ABSTRACT}
+
+\vspace{0.5cm}
+
+\BLOCK{if spec.conference}
+\normalsize\textit{\VAR{spec.conference}}
+
+\vspace{0.3cm}
+
+\BLOCK{endif}
+\large\textbf{\VAR{spec.working_title}}
+
+\BLOCK{if spec.author}
+\vspace{0.3cm}
+
+\normalsize\textbf{Author: \VAR{spec.author[0]}}
+
+\VAR{spec.author[1]}
+
+\VAR{spec.author[2]}
+
+\BLOCK{endif}
+\vspace{0.5cm}
+\end{center}
+
+\textbf{Abstract:}
+
+\vspace{0.2cm}
+
+\VAR{spec.abstract_text}
+
+\vspace{0.5cm}
+
+\textbf{\VAR{spec.requirements_heading}:}
+
+\vspace{0.2cm}
+
+\begin{itemize}[leftmargin=0.5in, itemsep=0.1cm]
+\BLOCK{for label, text in spec.requirements}
+\item \textbf{\VAR{label}:} \VAR{text}
+\BLOCK{endfor}
+\end{itemize}
+
+\vspace{0.5cm}
+
+\BLOCK{if spec.specs}
+\textbf{Technical Specifications:}
+
+\vspace{0.2cm}
+
+\begin{itemize}[leftmargin=0.5in, itemsep=0.1cm]
+\BLOCK{for label, text in spec.specs}
+\item \textbf{\VAR{label}:} \VAR{text}
+\BLOCK{endfor}
+\end{itemize}
+
+\vspace{0.5cm}
+
+\BLOCK{endif}
+\begin{center}
+\small\textit{Module: \VAR{spec.module_id} - \VAR{spec.module_name} (\VAR{spec.module_description})}
+\end{center}
+
+\end{document}
+"""
+
+# One environment for every abstract module, compiled on first use
+_ENV = latex_environment({"abstract": ABSTRACT_TEX})
+
+
+@dataclass(frozen=True)
+class AbstractSpec:
+    """Everything that varies between abstract pages"""
+    module_dir: Path
+    module_id: str
+    module_name: str
+    module_description: str
+    label: str                    # used in progress messages, e.g. "J1"
+    working_title: str
+    abstract_text: str
+    requirements_heading: str
+    requirements: tuple           # ((label, text), ...)
+    specs: tuple = ()             # ((label, text), ...); section omitted if empty
+    conference: str = ""          # shown under ABSTRACT when set
+    author: tuple = ()            # (name, institution, focus); omitted if empty
+    page_number: str = ""         # printed by the matplotlib fallback
+
+
+def render(spec):
+    """Generate the abstract PDF for spec and return its path"""
+    output_dir = spec.module_dir / "output"
+    output_dir.mkdir(exist_ok=True)
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+    # Generate PDF
+    pdf_path = output_dir / f"abstract_{spec.module_id}_{timestamp}.pdf"
+    latex_content = _ENV.get_template("abstract").render(spec=spec)
+
+    # The source depends only on the spec, so recompile only when it (or the
+    # template) changes
+    key = hashlib.sha256(latex_content.encode()).hexdigest()[:16]
+    cached_pdf = spec.module_dir / ".cache" / f"abstract_{spec.module_id}_{key}.pdf"
+    if not cached_pdf.exists() and not compile_latex(latex_content, cached_pdf):
+        return generate_simple_abstract(spec, pdf_path, now)
+
+    # Stamp the generation time in the bottom margin of the last page
+    stamp_page(cached_pdf, [
+        (4.25, 0.35, 10.95, False, 'black', f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}", 'center'),
+    ], pdf_path, fonts=("Times-Italic", "Times-BoldItalic"), page=-1, frame=PAGE_FRAME)
+    print(f"✅ Generated {spec.label} abstract: {pdf_path}")
+    return str(pdf_path)
+
+
+def generate_simple_abstract(spec, pdf_path, now):
+    """Draw the abstract with matplotlib, importing it only when needed"""
+    from modules.abstract_fallback import generate_simple_abstract
+    return generate_simple_abstract(spec, pdf_path, now)
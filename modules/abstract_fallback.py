@@ -0,0 +1,137 @@
+"""
+abstract_fallback.py
+Matplotlib fallback for the shared abstract page.
+Author: Michael Maloney
+PhD Student - Penn State Architectural Engineering Department
+
+Only imported by modules/abstract.py when no LaTeX engine is available, so the
+normal path never pays for loading matplotlib.
+"""
+
+import textwrap
+from functools import lru_cache
+
+import matplotlib
+matplotlib.use('pdf')  # non-interactive; never probe for a GUI backend
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+
+# Process-wide settings, applied once rather than on every page; TrueType
+# (Type 42) embedding writes the font as-is instead of building Type 3 glyphs
+plt.rcParams.update({
+    'font.family': 'Arial',
+    'font.sans-serif': ['Arial'],
+    'pdf.fonttype': 42,
+})
+
+# Wrappers for the title, abstract body and requirement lines, built once
+_WRAP_TITLE = textwrap.TextWrapper(width=50)
+_WRAP_BODY = textwrap.TextWrapper(width=60)
+_WRAP_REQ = textwrap.TextWrapper(width=70)
+
+
+@lru_cache(maxsize=None)
+def wrapped_sentences(text):
+    """Split abstract text into sentences, each pre-wrapped for the page"""
+    parts = text.split('. ')
+    sentences = (part + ('.' if i < len(parts) - 1 else '') for i, part in enumerate(parts))
+    return tuple(tuple(_WRAP_BODY.wrap(sentence)) for sentence in sentences if sentence.strip())
+
+
+def generate_simple_abstract(spec, pdf_path, now):
+    """Simple matplotlib fallback for the abstract page"""
+    try:
+        with PdfPages(pdf_path) as pdf:
+            # Create figure with proper margins
+            fig = plt.figure(figsize=(8.5, 11))  # Letter size
+            plt.axis('off')
+
+            # Define proper spacing constants
+            TOP_MARGIN = 0.95
+            LINE_HEIGHT = 0.05
+            SECTION_SPACING = 0.08
+
+            # LINE_HEIGHT in points, so multi-line blocks keep the same pitch
+            # (matplotlib spaces lines by fontsize * linespacing points)
+            line_pt = LINE_HEIGHT * plt.gca().get_position().height * fig.get_figheight() * 72
+
+            def block(y, lines, fontsize, weight='normal'):
+                """Draw lines as one centred Text artist, the first line centred at y"""
+                plt.text(0.5, y - (len(lines) - 1) * LINE_HEIGHT / 2, '\n'.join(lines),
+                         fontsize=fontsize, weight=weight, linespacing=line_pt / fontsize,
+                         ha='center', va='center', color='black',
+                         transform=plt.gca().transAxes)
+
+            def line(y, text, fontsize, weight='normal'):
+                block(y, [text], fontsize, weight)
+
+            # Title - properly positioned
+            line(TOP_MARGIN, 'ABSTRACT', 24, 'bold')
+            y_pos = TOP_MARGIN - LINE_HEIGHT
+
+            # Conference info
+            if spec.conference:
+                line(y_pos, spec.conference, 16)
+                y_pos -= LINE_HEIGHT
+
+            # Paper title - properly positioned with spacing
+            title_lines = _WRAP_TITLE.wrap(spec.working_title)
+            block(y_pos, title_lines, 18, 'bold')
+            y_pos -= LINE_HEIGHT * len(title_lines)
+
+            # Author info
+            if spec.author:
+                name, institution, focus = spec.author
+                y_pos -= SECTION_SPACING
+                line(y_pos, f"Author: {name}", 14, 'bold')
+                y_pos -= LINE_HEIGHT
+                block(y_pos, [institution, focus], 12)
+                y_pos -= LINE_HEIGHT
+
+            # Abstract section - properly positioned
+            y_pos -= SECTION_SPACING
+            line(y_pos, 'Abstract:', 16, 'bold')
+            y_pos -= LINE_HEIGHT
+
+            # One centred paragraph per sentence, with extra space between
+            for lines in wrapped_sentences(spec.abstract_text):
+                block(y_pos, lines, 12)
+                y_pos -= LINE_HEIGHT * len(lines) + 0.02
+
+            # Abstract Questions and Response section
+            y_pos -= SECTION_SPACING
+            line(y_pos, f"{spec.requirements_heading}:", 14, 'bold')
+            y_pos -= LINE_HEIGHT
+            for label, text in spec.requirements:
+                lines = _WRAP_REQ.wrap(f"• {label}: {text}")
+                block(y_pos, lines, 11)
+                y_pos -= LINE_HEIGHT * len(lines) + 0.02
+
+            # Technical Specifications section
+            if spec.specs:
+                y_pos -= SECTION_SPACING
+                line(y_pos, 'Technical Specifications:', 14, 'bold')
+                y_pos -= LINE_HEIGHT
+                specs = [f"• {label}: {text}" for label, text in spec.specs]
+                block(y_pos, specs, 11)
+                y_pos -= LINE_HEIGHT * len(specs)
+
+            # Page number
+            if spec.page_number:
+                line(0.05, spec.page_number, 14)
+
+            # Timestamp - properly positioned at bottom
+            line(0.03, f'Generated: {now.strftime("%Y-%m-%d %H:%M:%S")}', 10)
+
+            # Module identifier
+            line(0.01, f'Module: {spec.module_id} - {spec.module_name} ({spec.module_description})', 10)
+
+            pdf.savefig(fig, facecolor='white')
+            plt.close(fig)
+
+        print(f"✅ Generated {spec.label} abstract: {pdf_path}")
+        return str(pdf_path)
+
+    except Exception as e:
+        print(f"❌ All generation methods failed: {e}")
+        return None
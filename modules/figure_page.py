@@ -0,0 +1,131 @@
+"""
+figure_page.py
+Shared Google Drawing figure page for the J1 system.
+Author: Michael Maloney
+PhD Student - Penn State Architectural Engineering Department
+
+Figure modules (the graphical abstract, the system schematic) all lay out the
+same page: a title, the drawing scaled into a fixed region, a figure number,
+a one-line caption, a link back to the drawing and the standard footer. Each
+module describes its page with a `FigurePageSpec` and hands it to `render`.
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from reportlab.lib.units import inch
+
+from modules.pdf_canvas import (new_canvas, draw_text_block, page_chrome, draw_link_box, png_size,
+                                to_page, AXES_FRAME, IMAGE_AXES_FRAME)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DOWNLOADS_DIR = REPO_ROOT / "downloads"
+
+# Add Google Drive helpers to path
+sys.path.append(str(REPO_ROOT / "0Z.00_Google_Sheet_Helper_Functions"))
+from google_drive_helpers import download_asset
+
+# Drawing region below the title, in layout units
+IMAGE_WIDTH = 6.5
+IMAGE_MAX_HEIGHT = 5.5
+IMAGE_TOP = 8
+
+
+@dataclass(frozen=True)
+class FigurePageSpec:
+    """Everything that varies between figure pages"""
+    module_dir: Path
+    module_id: str
+    title: str                    # page title, also used in the module label
+    figure_label: str             # e.g. "Figure 2"
+    caption: str                  # one-sentence description under the figure
+    drawing_link: str             # Google Drawing edit URL
+    page_number: str
+    output_name: str              # PDF name prefix, e.g. "graphical_abstract"
+
+
+def render(spec):
+    """Generate the figure page PDF for spec and return its path"""
+    output_dir = spec.module_dir / "output"
+    output_dir.mkdir(exist_ok=True)
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+    # Download fresh Google Drawing asset
+    print(f"📥 Downloading fresh {spec.title} from Google Drive...")
+    asset_path = download_asset(
+        url=spec.drawing_link,
+        module_id=spec.module_id,
+        filename=f"{spec.module_id}_asset.png"
+    )
+
+    if not asset_path:
+        print(f"❌ Failed to download fresh asset for {spec.module_id}")
+        # Fallback to existing asset if download fails
+        asset_path = DOWNLOADS_DIR / f"{spec.module_id}_asset.png"
+
+    # Draw the page directly on a ReportLab canvas
+    output_file = output_dir / f"{spec.output_name}_{spec.module_id}_{timestamp}.pdf"
+    c = new_canvas(output_file)
+
+    # Title - Left justified with book-style spacing (like 01.00)
+    entries = [(0.1, 9.9, 18, True, 'black', spec.title)]
+
+    # Add the Google Drawing - prominently displayed with book-style spacing
+    try:
+        # Only the size is needed for layout; read it from the PNG header. A
+        # missing file raises here, so no separate exists() check is needed
+        pixel_width, pixel_height = png_size(asset_path)
+
+        # Fit the page width, unless that would exceed the available height
+        aspect_ratio = pixel_height / pixel_width
+        img_width, img_height = IMAGE_WIDTH, IMAGE_WIDTH * aspect_ratio
+        if img_height > IMAGE_MAX_HEIGHT:
+            img_width, img_height = IMAGE_MAX_HEIGHT / aspect_ratio, IMAGE_MAX_HEIGHT
+
+        # Center the image horizontally, hanging from the top of the region
+        x_pos = (8.5 - img_width) / 2
+        y_pos = IMAGE_TOP - img_height
+
+        # Add image at its native resolution (no resampling pass), with
+        # its alpha channel kept as a soft mask. The page is laid out in the
+        # equal-aspect frame imshow gave the original axes
+        frame = IMAGE_AXES_FRAME
+        scale = frame[2]
+        page_x, page_y = to_page(x_pos, y_pos, frame)
+        c.drawImage(str(asset_path), page_x * inch, page_y * inch,
+                    img_width * scale * inch, img_height * scale * inch, mask='auto')
+
+        # Figure number and one-sentence description with book spacing
+        entries += [
+            (0.1, y_pos - 0.8, 14, True, 'black', spec.figure_label),
+            (0.1, y_pos - 1.2, 12, False, 'black', spec.caption),
+        ]
+
+        # Google Drawing link - small and clean with book spacing
+        draw_link_box(c, 0.1, y_pos - 1.6, 9, f"Source: {spec.drawing_link}", spec.drawing_link, frame)
+
+        print(f"✅ Fresh {spec.title} loaded successfully")
+
+    except Exception as e:
+        print(f"⚠️ Warning: Could not load image: {e}")
+        frame = AXES_FRAME
+        # Placeholder text with book spacing
+        entries += [
+            (0.1, 6, 14, True, 'gray', f"{spec.title} Image"),
+            (0.1, 5.5, 10, False, 'gray', "(Image will be integrated from Google Drawing)"),
+        ]
+        draw_link_box(c, 0.1, 5.2, 9, f"Source: {spec.drawing_link}", frame=frame)
+
+    # Page number, timestamp and module identifier
+    entries += page_chrome(spec.page_number, f"Module: {spec.module_id} - {spec.title}", now)
+
+    # Save as PDF
+    draw_text_block(c, entries, frame=frame)
+    c.showPage()
+    c.save()
+
+    print(f"✅ {spec.title} generated: {output_file}")
+    return str(output_file)
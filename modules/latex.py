@@ -0,0 +1,184 @@
+"""
+latex.py
+Shared LaTeX compilation for the J1 system.
+Author: Michael Maloney
+PhD Student - Penn State Architectural Engineering Department
+
+Modules that typeset with LaTeX (cover, abstract) hand their source to
+`compile_latex` instead of each driving pdflatex themselves. Tectonic is used
+when it is installed: it keeps its format file and package bundle cached
+between runs, so a small page compiles without pdflatex's per-run format load.
+pdflatex remains the fallback; for it each distinct preamble is dumped once
+into a format file (mylatexformat) so later compiles skip loading packages.
+
+Templated documents are rendered through `latex_environment`, a Jinja2
+environment using \\VAR{...}/\\BLOCK{...} delimiters (which never clash with TeX
+braces) and escaping every substituted value with `latex_escape`.
+"""
+
+import os
+import re
+import hashlib
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+
+# Resolve the engine once per process rather than on every compile
+if shutil.which('tectonic'):
+    LATEX_ENGINE = 'tectonic'
+elif shutil.which('pdflatex'):
+    LATEX_ENGINE = 'pdflatex'
+else:
+    LATEX_ENGINE = None
+
+# Precompiled preamble formats, shared by every module in the repo
+FORMAT_DIR = Path(__file__).resolve().parent.parent / ".cache" / "latex"
+
+# Commands whose output depends on the .aux file of a previous pass
+_CROSS_REFERENCES = re.compile(r'\\(?:ref|pageref|eqref|cite|tableofcontents|listoffigures|listoftables)\b')
+
+# Compiled Jinja2 template bytecode, reused across runs
+JINJA_CACHE_DIR = FORMAT_DIR.parent / "jinja"
+
+_LATEX_SPECIALS = {
+    '\\': r'\textbackslash{}', '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#',
+    '_': r'\_', '{': r'\{', '}': r'\}', '~': r'\textasciitilde{}', '^': r'\textasciicircum{}',
+}
+
+
+def latex_escape(text):
+    """Escape LaTeX special characters in plain text"""
+    return ''.join(_LATEX_SPECIALS.get(ch, ch) for ch in str(text))
+
+
+def latex_environment(templates):
+    """
+    Jinja2 environment over a {name: source} dict of LaTeX templates. Templates
+    are compiled on first use and kept for the life of the process; their
+    bytecode is also written to disk so later runs skip parsing altogether.
+    Entries are keyed by template name and checked against the source, so an
+    edited template simply overwrites its entry and the cache never grows.
+    """
+    JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=DictLoader(templates),
+        auto_reload=False,
+        cache_size=-1,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        finalize=latex_escape,
+        bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE_DIR)),
+        block_start_string='\\BLOCK{', block_end_string='}',
+        variable_start_string='\\VAR{', variable_end_string='}',
+        comment_start_string='\\#{', comment_end_string='}',
+    )
+
+
+def preamble_format(latex_content):
+    """
+    Name of a pdflatex format holding this document's preamble, dumped with
+    mylatexformat on first use. The name carries a hash of the preamble, so
+    editing it builds a fresh format. Returns None if the format can't be built.
+    """
+    preamble = latex_content.split('\\begin{document}')[0]
+    name = f"preamble_{hashlib.sha256(preamble.encode()).hexdigest()[:16]}"
+    if (FORMAT_DIR / f"{name}.fmt").exists():
+        return name
+
+    # Modules compile concurrently, so build under a per-process job name and
+    # move the finished format into place atomically
+    FORMAT_DIR.mkdir(parents=True, exist_ok=True)
+    job = f"{name}_{os.getpid()}"
+    (FORMAT_DIR / f"{job}.tex").write_text(preamble + "\\begin{document}\n\\end{document}\n")
+    try:
+        subprocess.run(['pdflatex', '-ini', f'-jobname={job}', '&pdflatex',
+                        'mylatexformat.ltx', f'{job}.tex'],
+                       cwd=FORMAT_DIR, capture_output=True, text=True, timeout=120)
+        os.replace(FORMAT_DIR / f"{job}.fmt", FORMAT_DIR / f"{name}.fmt")
+    except Exception as e:
+        print(f"⚠️ Could not build LaTeX preamble format: {e}")
+        return None
+    finally:
+        for leftover in FORMAT_DIR.glob(f"{job}.*"):
+            leftover.unlink()
+    return name
+
+
+def needs_second_pass(latex_content):
+    """True if the document resolves references through its .aux file"""
+    return bool(_CROSS_REFERENCES.search(latex_content))
+
+
+def engine_command(tex_file, output_dir, fmt=None, draft=False):
+    """
+    Command line that compiles tex_file into output_dir with the chosen engine.
+    ``draft`` makes a pdflatex pass that only writes the .aux file.
+    """
+    if LATEX_ENGINE == 'tectonic':
+        return ['tectonic', '--chatter', 'minimal', '--outdir', str(output_dir), str(tex_file)]
+    command = ['pdflatex', '-interaction=batchmode', '-halt-on-error', '-no-shell-escape',
+               '-output-directory=' + str(output_dir)]
+    if fmt:
+        command.append(f'-fmt={fmt}')
+    if draft:
+        command.append('-draftmode')
+    return command + [str(tex_file)]
+
+
+def run_engine(tex_file, build_dir, env, timeout, fmt=None, passes=1):
+    """Run the engine over tex_file; all but the last pdflatex pass are drafts"""
+    if LATEX_ENGINE == 'pdflatex':
+        for _ in range(passes - 1):
+            subprocess.run(engine_command(tex_file, build_dir, fmt, draft=True), env=env,
+                           capture_output=True, text=True, timeout=timeout)
+    return subprocess.run(engine_command(tex_file, build_dir, fmt), env=env,
+                          capture_output=True, text=True, timeout=timeout)
+
+
+def compile_latex(latex_content, pdf_path, timeout=60):
+    """
+    Compile LaTeX source to pdf_path. Returns True on success; on failure the
+    engine's error output is printed and False is returned so callers can fall
+    back to their simple generators.
+    """
+    if LATEX_ENGINE is None:
+        print("❌ LaTeX compilation failed: neither tectonic nor pdflatex is installed")
+        return False
+
+    pdf_path = Path(pdf_path)
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fmt = preamble_format(latex_content) if LATEX_ENGINE == 'pdflatex' else None
+    # Simple pages have nothing to resolve, so one pass is enough; tectonic
+    # reruns by itself when it needs to
+    passes = 2 if needs_second_pass(latex_content) else 1
+    # Let kpathsea find our formats ahead of the system ones
+    env = dict(os.environ, TEXFORMATS=f"{FORMAT_DIR}{os.pathsep}")
+
+    # Build in a scratch directory beside the destination so .aux/.log files
+    # vanish with it and the finished PDF is a same-filesystem rename away
+    with tempfile.TemporaryDirectory(dir=pdf_path.parent, prefix='.latex_') as build_dir:
+        tex_file = Path(build_dir) / "document.tex"
+        tex_file.write_text(latex_content)
+        generated_pdf = tex_file.with_suffix('.pdf')
+        try:
+            result = run_engine(tex_file, build_dir, env, timeout, fmt, passes)
+            if fmt and not generated_pdf.exists():
+                # A stale format (e.g. after a TeX upgrade) - retry the slow way
+                result = run_engine(tex_file, build_dir, env, timeout, passes=passes)
+        except Exception as e:
+            print(f"❌ LaTeX generation failed: {e}")
+            return False
+
+        if not generated_pdf.exists():
+            # batchmode keeps pdflatex quiet on the terminal; the log has the error
+            log_file = tex_file.with_suffix('.log')
+            log = log_file.read_text(errors='replace') if log_file.exists() else result.stdout
+            print(f"❌ LaTeX compilation failed: {result.stderr or log[-2000:]}")
+            return False
+        os.replace(generated_pdf, pdf_path)
+    return True
@@ -0,0 +1,209 @@
+"""
+pdf_canvas.py
+Lightweight ReportLab page helpers for the J1 system.
+Author: Michael Maloney
+PhD Student - Penn State Architectural Engineering Department
+
+Text-only pages (cover, module status overview, table of contents) do not need
+matplotlib's figure/axes machinery. These helpers place text directly on a
+ReportLab canvas. Positions are given in the coordinates of the matplotlib
+axes the pages were originally laid out on (0-8.5 x 0-11 inside the default
+subplot margins) and mapped to the page through a frame, so layouts can be
+ported one `ax.text` call at a time and still land where they used to.
+"""
+
+import io
+import os
+import struct
+import hashlib
+import warnings
+from pathlib import Path
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfgen import canvas
+
+# pypdf preserves hyperlinks better than PyPDF2, but either can merge pages
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:
+    # Late PyPDF2 releases warn on import that the package is deprecated
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        from PyPDF2 import PdfReader, PdfWriter
+
+# Helvetica is metric-compatible with Arial and is one of the 14 core PDF fonts,
+# so nothing has to be embedded or looked up on disk
+FONT_REGULAR = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+
+PAGE_WIDTH_IN = 8.5
+PAGE_HEIGHT_IN = 11
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Frames map layout coordinates to page inches as (x0, y0, x_scale, y_scale).
+# The matplotlib pages drew on an axes spanning 0-8.5 x 0-11 data units inside
+# the default subplot margins (left 0.125, bottom 0.11, width 0.775, height 0.77)
+AXES_FRAME = (0.125 * PAGE_WIDTH_IN, 0.11 * PAGE_HEIGHT_IN, 0.775, 0.77)
+# Once imshow has drawn on that axes it keeps equal aspect: the box narrows to
+# the 0.77 height scale and stays centred horizontally
+IMAGE_AXES_FRAME = (0.125 * PAGE_WIDTH_IN + (0.775 - 0.77) * PAGE_WIDTH_IN / 2,
+                    0.11 * PAGE_HEIGHT_IN, 0.77, 0.77)
+# Raw page inches, for stamping onto pages laid out by something else (LaTeX)
+PAGE_FRAME = (0, 0, 1, 1)
+
+# Digest of these helpers, part of every cache key for pages drawn with them,
+# so a layout or font change here invalidates the cached renders
+RENDER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def to_page(x, y, frame=AXES_FRAME):
+    """Map a layout point to page inches measured from the bottom-left corner"""
+    x0, y0, x_scale, y_scale = frame
+    return x0 + x * x_scale, y0 + y * y_scale
+
+
+def new_canvas(output_file):
+    """Create a letter-size canvas for the given output path"""
+    return canvas.Canvas(str(output_file), pagesize=letter)
+
+
+def draw_text_block(c, entries, fonts=(FONT_REGULAR, FONT_BOLD), frame=AXES_FRAME):
+    """
+    Draw a block of text entries on a canvas.
+
+    Each entry is a tuple ``(x, y, size, bold, color, text)`` with an optional
+    seventh ``align`` element ('left', 'center' or 'right'; default 'left').
+    ``x``/``y`` are layout coordinates mapped to the page through ``frame``
+    and mark the vertical center of the line, matching matplotlib's
+    ``va='center'``; font sizes stay in points, as in matplotlib.
+    ``fonts`` is the (regular, bold) pair of core PDF font names to draw with.
+    """
+    # Only emit font/colour operators when they change between entries, so a
+    # table of same-styled rows costs one setFont per style run, not per cell
+    current_font = current_color = None
+    for entry in entries:
+        x, y, size, bold, color, text = entry[:6]
+        align = entry[6] if len(entry) > 6 else 'left'
+
+        font = (fonts[1] if bold else fonts[0], size)
+        if font != current_font:
+            c.setFont(*font)
+            current_font = font
+        if color != current_color:
+            c.setFillColor(getattr(colors, color))
+            current_color = color
+
+        # drawString positions the baseline; shift down ~0.35 em to center the line
+        x, y = to_page(x, y, frame)
+        x_pt = x * inch
+        y_pt = y * inch - size * 0.35
+        if align == 'center':
+            c.drawCentredString(x_pt, y_pt, text)
+        elif align == 'right':
+            c.drawRightString(x_pt, y_pt, text)
+        else:
+            c.drawString(x_pt, y_pt, text)
+
+
+def page_chrome(page_number, module_text, generated, x=0.1):
+    """
+    Footer entries shared by the journal pages: the centred page number, then
+    the grey generation time and module label at left margin ``x``, all in
+    layout units.
+    """
+    return [
+        (4.25, 0.5, 14, False, 'black', page_number, 'center'),
+        (x, 0.3, 10, False, 'gray', f"Generated: {generated.strftime('%Y-%m-%d %H:%M:%S')}"),
+        (x, 0.1, 10, False, 'gray', module_text),
+    ]
+
+
+def draw_hline(c, y, x_start, x_end, width=0.5, color='black', frame=AXES_FRAME):
+    """Draw a horizontal rule at layout height y between x_start and x_end"""
+    x_start, y_page = to_page(x_start, y, frame)
+    x_end, _ = to_page(x_end, y, frame)
+    c.setStrokeColor(getattr(colors, color))
+    c.setLineWidth(width)
+    c.line(x_start * inch, y_page * inch, x_end * inch, y_page * inch)
+
+
+def png_size(path):
+    """Return a PNG's (width, height) in pixels from its IHDR chunk, without decoding it"""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    if header[:8] != PNG_SIGNATURE or header[12:16] != b'IHDR':
+        raise ValueError(f"Not a PNG file: {path}")
+    return struct.unpack('>II', header[16:24])
+
+
+def draw_link_box(c, x, y, size, text, url=None, frame=AXES_FRAME):
+    """
+    Draw a left-aligned blue line of text at layout point (x, y) on a rounded
+    light blue box, the canvas counterpart of matplotlib's
+    ``bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.7)``.
+    When ``url`` is given the box is also a clickable link.
+    """
+    pad = 0.3 * size
+    x_page, y_page = to_page(x, y, frame)
+    x0 = x_page * inch - pad
+    y0 = y_page * inch - size / 2 - pad
+    width = c.stringWidth(text, FONT_REGULAR, size) + 2 * pad
+    height = size + 2 * pad
+    c.saveState()
+    c.setFillColor(colors.lightblue)
+    c.setFillAlpha(0.7)
+    c.setStrokeAlpha(0.7)
+    c.roundRect(x0, y0, width, height, radius=pad, stroke=1, fill=1)
+    c.restoreState()
+    draw_text_block(c, [(x, y, size, False, 'blue', text)], frame=frame)
+    if url:
+        c.linkURL(url, (x0, y0, x0 + width, y0 + height), relative=0)
+
+
+def cached_template(cache_dir, name, entries, frame=AXES_FRAME):
+    """
+    Return a one-page PDF holding the static text entries, rendering it only
+    when no cached copy exists. The file name carries a hash of the entries,
+    frame and RENDER_VERSION so editing the layout invalidates the cache
+    automatically.
+    """
+    key = hashlib.sha256(repr((RENDER_VERSION, frame, entries)).encode()).hexdigest()[:16]
+    template_file = cache_dir / f"{name}_{key}.pdf"
+    if not template_file.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Render beside the cache entry and rename it into place, so an
+        # interrupted run never leaves a half-written template behind
+        tmp_file = template_file.with_suffix('.pdf.part')
+        c = new_canvas(tmp_file)
+        draw_text_block(c, entries, frame=frame)
+        c.showPage()
+        c.save()
+        os.replace(tmp_file, template_file)
+    return template_file
+
+
+def stamp_page(template_file, entries, output_file, fonts=(FONT_REGULAR, FONT_BOLD), page=0,
+               frame=AXES_FRAME):
+    """
+    Overlay the dynamic text entries onto a cached template and write the
+    result. Every page of the template is kept; ``page`` selects which one is
+    stamped (negative indices count from the end). ``frame`` must be the one
+    the template was laid out in (PAGE_FRAME for LaTeX pages).
+    """
+    overlay = io.BytesIO()
+    c = canvas.Canvas(overlay, pagesize=letter)
+    draw_text_block(c, entries, fonts, frame)
+    c.showPage()
+    c.save()
+    overlay.seek(0)
+
+    writer = PdfWriter()
+    for template_page in PdfReader(str(template_file)).pages:
+        writer.add_page(template_page)
+    # Merge onto the writer's copy; pypdf deprecates editing unattached pages
+    writer.pages[page % len(writer.pages)].merge_page(PdfReader(overlay).pages[0])
+    with open(output_file, 'wb') as f:
+        writer.write(f)
@@ -0,0 +1,242 @@
+"""
+spreadsheet_page.py
+Shared Google Spreadsheet table page for the J1 system.
+Author: Michael Maloney
+PhD Student - Penn State Architectural Engineering Department
+
+Library modules (model, scenario and simulation libraries) all lay out the
+same page: a title, one spreadsheet tab exported as PDF and placed on the page
+as vector content, a table number, a one-line caption, a link back to the sheet
+and the standard footer. Each module describes its page with a
+`SpreadsheetPageSpec` and hands it to `render`. The page is built once per
+distinct export and cached; each run only stamps its generation time onto it.
+"""
+
+import io
+import os
+import hashlib
+import json
+import shutil
+import warnings
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+
+import requests
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.pdfgen import canvas
+
+from modules.pdf_canvas import (draw_text_block, page_chrome, draw_link_box, stamp_page,
+                                to_page, IMAGE_AXES_FRAME, RENDER_VERSION)
+
+# pypdf preserves hyperlinks better than PyPDF2, but either can merge pages
+try:
+    from pypdf import PdfReader, PdfWriter, Transformation
+except ImportError:
+    # Late PyPDF2 releases warn on import that the package is deprecated
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        from PyPDF2 import PdfReader, PdfWriter, Transformation
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DOWNLOADS_DIR = REPO_ROOT / "downloads"
+
+# One keep-alive session per process, so the library pages rendered in the
+# same process share a connection to docs.google.com
+_SESSION = requests.Session()
+
+# Spreadsheet region above the caption, in layout units
+SHEET_LEFT = 0.25
+SHEET_WIDTH = 8.0
+SHEET_MAX_HEIGHT = 7.0
+SHEET_BOTTOM = 2.0
+
+# The original page was an equal-aspect (imshow) matplotlib axes; the
+# placeholder uses the same frame so the cached page and the stamped
+# timestamp always agree
+FRAME = IMAGE_AXES_FRAME
+
+
+@dataclass(frozen=True)
+class SpreadsheetPageSpec:
+    """Everything that varies between spreadsheet pages"""
+    module_dir: Path
+    module_id: str
+    title: str                    # page title, also used in the module label
+    tab: str                      # sheet tab name, e.g. "model_library"
+    spreadsheet_id: str
+    gid: str                      # gid of the tab to export
+    spreadsheet_link: str         # edit URL linked from the page
+    table_label: str              # e.g. "Table 1"
+    caption: str                  # one-sentence description under the table
+    page_number: str
+    output_name: str              # PDF name prefix, e.g. "model_library"
+
+
+def download_google_spreadsheet_as_pdf(spec):
+    """Download the spec's spreadsheet tab as PDF - like Schedule module"""
+    try:
+        return fetch_spreadsheet_pdf(spec, date.today())
+    except Exception as e:
+        print(f"❌ Error downloading spreadsheet as PDF: {e}")
+        return None
+
+
+@lru_cache(maxsize=8)
+def fetch_spreadsheet_pdf(spec, day):
+    """
+    Fetch the tab's PDF export and return its path, raising on failure.
+    Memoised per spec and calendar day, so rendering the same page again in
+    one process (a pool worker, a notebook session) skips even the
+    conditional GET; failures raise and are therefore never cached.
+    """
+
+    # Convert to PDF download URL targeting the tab's gid
+    pdf_url = f"https://docs.google.com/spreadsheets/d/{spec.spreadsheet_id}/export?format=pdf&gid={spec.gid}"
+
+    # Save PDF to downloads directory
+    pdf_path = DOWNLOADS_DIR / f"{spec.module_id}_{spec.tab}.pdf"
+    meta_path = DOWNLOADS_DIR / f".{spec.module_id}_{spec.tab}.meta.json"
+
+    # Conditional GET: send the validators from the last download so an
+    # unchanged spreadsheet comes back as a bodiless 304
+    headers = {}
+    if pdf_path.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_text())
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    # Download the PDF, streaming it to disk; it only replaces the cached copy
+    # once complete, and the validators are written after that, so an
+    # interrupted download never leaves a truncated file a 304 would keep
+    with _SESSION.get(pdf_url, headers=headers, stream=True, timeout=30) as response:
+        if response.status_code == 304:
+            print(f"✅ {spec.title} PDF unchanged, using cached copy: {pdf_path}")
+            return pdf_path
+        response.raise_for_status()
+
+        DOWNLOADS_DIR.mkdir(exist_ok=True)
+        response.raw.decode_content = True  # undo any gzip transfer encoding
+        tmp_path = pdf_path.with_suffix('.pdf.part')
+        with open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, length=64 * 1024)
+        os.replace(tmp_path, pdf_path)
+        meta_path.write_text(json.dumps({
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }))
+
+    print(f"✅ Downloaded {spec.title.lower()} PDF: {pdf_path}")
+    return pdf_path
+
+
+def render(spec):
+    """Generate the spreadsheet page PDF for spec and return its path"""
+
+    output_dir = spec.module_dir / "output"
+    output_dir.mkdir(exist_ok=True)
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+    # Download spreadsheet as PDF - like Schedule module
+    pdf_path = download_google_spreadsheet_as_pdf(spec)
+
+    # Page number, timestamp and module identifier; the timestamp changes
+    # every run, so it is stamped onto the cached page rather than drawn in it
+    page_number, generated, module_label = page_chrome(
+        spec.page_number, f"Module: {spec.module_id} - {spec.title}", now)
+
+    # The rest of the page depends only on this code, the pdf_canvas helpers
+    # that draw it, the spec and the exported sheet, so build it once per
+    # (code, helpers, spec, sheet) and reuse it
+    content = hashlib.sha256(Path(__file__).read_bytes())
+    content.update(repr((RENDER_VERSION, FRAME, spec)).encode())
+    if pdf_path:
+        content.update(pdf_path.read_bytes())
+    cached_pdf = spec.module_dir / ".cache" / f"{spec.output_name}_{spec.module_id}_{content.hexdigest()[:16]}.pdf"
+    if not cached_pdf.exists():
+        render_content(spec, pdf_path, [page_number, module_label], cached_pdf)
+
+    output_file = output_dir / f"{spec.output_name}_{spec.module_id}_{timestamp}.pdf"
+    stamp_page(cached_pdf, [generated], output_file, frame=FRAME)
+
+    print(f"✅ {spec.title} page generated: {output_file}")
+    return str(output_file)
+
+
+def render_content(spec, pdf_path, footer, output_file):
+    """Render the timestamp-free spreadsheet page to output_file"""
+
+    source_text = f"Source: Google Spreadsheet ({spec.tab} tab)"
+
+    # Draw the text, link and footer on a ReportLab page in memory; the
+    # spreadsheet page is merged underneath it as vector content afterwards
+    chrome = io.BytesIO()
+    c = canvas.Canvas(chrome, pagesize=letter)
+
+    # Title - Left justified with book-style spacing
+    entries = [(0.1, 9.9, 18, True, 'black', spec.title)]
+
+    # Add the spreadsheet page - prominently displayed with book-style spacing
+    try:
+        if not pdf_path:
+            raise FileNotFoundError(f"no {spec.title.lower()} PDF")
+        sheet_page = PdfReader(str(pdf_path)).pages[0]
+        box = sheet_page.mediabox
+
+        # Fit the table width, unless that would exceed the available height
+        aspect_ratio = float(box.height) / float(box.width)
+        sheet_width, sheet_height = SHEET_WIDTH, SHEET_WIDTH * aspect_ratio
+        if sheet_height > SHEET_MAX_HEIGHT:
+            sheet_width, sheet_height = SHEET_MAX_HEIGHT / aspect_ratio, SHEET_MAX_HEIGHT
+        scale = sheet_width * FRAME[2] * inch / float(box.width)
+        y_pos = SHEET_BOTTOM
+        page_x, page_y = to_page(SHEET_LEFT, y_pos, FRAME)
+
+        # Scale the page into place, moving its media box origin to the corner
+        sheet_transform = (Transformation()
+                           .translate(-float(box.left), -float(box.bottom))
+                           .scale(scale)
+                           .translate(page_x * inch, page_y * inch))
+
+        # Table number and one-sentence description with reduced spacing
+        entries += [
+            (0.1, y_pos - 0.5, 14, True, 'black', spec.table_label),
+            (0.1, y_pos - 0.8, 12, False, 'black', spec.caption),
+        ]
+
+        # Google Spreadsheet link - small and clean with reduced spacing
+        draw_link_box(c, 0.1, y_pos - 1.1, 9, source_text, spec.spreadsheet_link, FRAME)
+
+    except Exception as e:
+        print(f"⚠️ Warning: Could not load {spec.title.lower()} PDF: {e}")
+        sheet_page = None
+        # Add placeholder text with book spacing
+        entries += [
+            (0.1, 6, 14, True, 'gray', f"{spec.title} Spreadsheet"),
+            (0.1, 5.5, 10, False, 'gray', f"({spec.title} will be integrated from Google Spreadsheet)"),
+        ]
+        draw_link_box(c, 0.1, 5.2, 9, source_text, spec.spreadsheet_link, FRAME)
+
+    draw_text_block(c, entries + footer, frame=FRAME)
+    c.showPage()
+    c.save()
+
+    # Merge the spreadsheet export as vectors: its text stays selectable and
+    # nothing is rasterised at any dpi
+    writer = PdfWriter()
+    writer.add_page(PdfReader(chrome).pages[0])
+    if sheet_page is not None:
+        writer.pages[0].merge_transformed_page(sheet_page, sheet_transform, over=False)
+
+    # Save as PDF; write beside the cache entry and rename it into place, so
+    # an interrupted run never leaves a half-written page under a valid key
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_suffix('.pdf.part')
+    with open(tmp_file, 'wb') as f:
+        writer.write(f)
+    os.replace(tmp_file, output_file)